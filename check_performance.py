@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Performance Checks - Reproduce the measurements behind query and response changes
+
+Each check runs against DATABASE_URL and prints what it measured, so a claim
+like "the planner uses this index" can be re-checked on any database. Point
+it at a copy with representative data: on a near-empty database Postgres
+prefers sequential scans, so plan checks disable them for their one query
+to show the index is usable.
+
+Usage:
+    python check_performance.py                  # run every check
+    python check_performance.py provider-counts  # run one check
+    python check_performance.py --list
+"""
+
+import argparse
+import os
+import sys
+
+import psycopg2
+from psycopg2.extras import RealDictCursor
+from dotenv import load_dotenv
+
+# Add parent directory to path to import the API
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+load_dotenv()
+
+DATABASE_URL = os.getenv('DATABASE_URL', 'postgresql://localhost/storage_auctions')
+
+# name -> (function, description); filled in by @check
+CHECKS = {}
+
+
+def check(name, description):
+    """Register a check function under a command-line name"""
+    def register(func):
+        CHECKS[name] = (func, description)
+        return func
+    return register
+
+
+def get_db_connection():
+    """Create database connection"""
+    return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
+
+
+def explain(conn, query, params=(), seqscan=False):
+    """
+    EXPLAIN a query and return its plan as text
+
+    Args:
+        seqscan: Leave sequential scans enabled. By default they are turned
+            off for this query, since on a small database Postgres picks
+            them over any index
+    """
+    cursor = conn.cursor()
+    if not seqscan:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    cursor.execute("EXPLAIN " + query, params)
+    plan = '\n'.join(row['QUERY PLAN'] for row in cursor.fetchall())
+    cursor.execute("RESET enable_seqscan")
+    cursor.close()
+    return plan
+
+
+def explain_analyze(conn, query, params=()):
+    """Run a query under EXPLAIN ANALYZE and return the root plan node (JSON)"""
+    cursor = conn.cursor()
+    cursor.execute("EXPLAIN (ANALYZE, FORMAT JSON) " + query, params)
+    plan = cursor.fetchone()['QUERY PLAN'][0]['Plan']
+    cursor.close()
+    return plan
+
+
+def plan_nodes(node):
+    """Yield every node in a JSON plan tree"""
+    yield node
+    for child in node.get('Plans', []):
+        yield from plan_nodes(child)
+
+
+def plan_uses_index(conn, label, index_name, query, params=()):
+    """Print whether the plan for query uses index_name"""
+    plan = explain(conn, query, params)
+    used = index_name in plan
+    print(f"  {label}: {'uses' if used else 'does NOT use'} {index_name}")
+    if not used:
+        print('    ' + plan.replace('\n', '\n    '))
+    return used
+
+
+def api_client():
+    """Flask test client for the API, with the response cache disabled"""
+    import api_backend
+    api_backend._cache = None
+    return api_backend.app.test_client()
+
+
+# ============================================================================
+# Checks
+# ============================================================================
+
+@check('provider-counts', 'Provider list counts match the old join + COUNT(DISTINCT) query')
+def check_provider_counts(conn):
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT p.provider_id,
+               COUNT(DISTINCT a.auction_id) as active_auctions,
+               COUNT(DISTINCT f.facility_id) as facility_count
+        FROM providers p
+        LEFT JOIN auctions a ON p.provider_id = a.provider_id AND a.status = 'active'
+        LEFT JOIN facilities f ON p.provider_id = f.provider_id
+        GROUP BY p.provider_id
+    """)
+    expected = {str(row['provider_id']): (row['active_auctions'], row['facility_count'])
+                for row in cursor.fetchall()}
+    cursor.close()
+
+    response = api_client().get('/api/providers?active_only=false')
+    providers = response.get_json()['providers']
+    actual = {p['provider_id']: (p['active_auctions'], p['facility_count']) for p in providers}
+
+    mismatched = sorted(pid for pid in expected if expected[pid] != actual.get(pid))
+    print(f"  {len(expected)} providers compared, {len(mismatched)} mismatched")
+    for pid in mismatched:
+        print(f"    {pid}: expected {expected[pid]}, got {actual.get(pid)}")
+    return not mismatched and len(actual) == len(expected)
+
+
+# The shape of the query /api/search builds (see search_auctions)
+SEARCH_QUERY = """
+    SELECT a.*, p.name as provider_name
+    FROM auctions a
+    LEFT JOIN providers p ON a.provider_id = p.provider_id
+    WHERE a.status = 'active'
+"""
+SEARCH_ORDER = " ORDER BY a.closes_at ASC, a.auction_id ASC LIMIT 20"
+
+
+@check('search-filter-indexes', 'Search filters use the indexes from add_search_filter_indexes.sql')
+def check_search_filter_indexes(conn):
+    cursor = conn.cursor()
+    cursor.execute("SELECT city FROM auctions WHERE status = 'active' AND city IS NOT NULL LIMIT 1")
+    city = cursor.fetchone()
+    cursor.execute("SELECT tag_name FROM tags LIMIT 1")
+    tag = cursor.fetchone()
+    cursor.close()
+
+    results = [
+        plan_uses_index(conn, 'city filter', 'idx_auctions_active_city_closes_id',
+                        SEARCH_QUERY + " AND a.city = %s" + SEARCH_ORDER,
+                        (city['city'] if city else 'Sacramento',)),
+        plan_uses_index(conn, 'bid range', 'idx_auctions_active_bid',
+                        SEARCH_QUERY + " AND a.current_bid >= %s AND a.current_bid <= %s" + SEARCH_ORDER,
+                        (100, 200)),
+        plan_uses_index(conn, 'tag filter', 'idx_auction_tags_tag_auction',
+                        SEARCH_QUERY + """
+                            AND EXISTS (
+                                SELECT 1 FROM auction_tags at
+                                JOIN tags t ON at.tag_id = t.tag_id
+                                WHERE at.auction_id = a.auction_id
+                                  AND t.tag_name = ANY(%s)
+                            )""" + SEARCH_ORDER,
+                        ([tag['tag_name'] if tag else 'furniture'],)),
+    ]
+    return all(results)
+
+
+@check('response-compression', 'Listing JSON is compressed (sizes per Accept-Encoding)')
+def check_response_compression(conn):
+    import api_backend
+    if not (api_backend.Compress and api_backend.COMPRESS_RESPONSES):
+        print("  Flask-Compress not installed or COMPRESS_RESPONSES=false")
+        return False
+
+    client = api_client()
+    sizes = {}
+    for encoding in ('identity', 'gzip', 'br'):
+        response = client.get('/api/auctions?limit=100', headers={'Accept-Encoding': encoding})
+        sizes[encoding] = len(response.get_data())
+        served = response.headers.get('Content-Encoding', 'identity')
+        print(f"  /api/auctions?limit=100 with {encoding:8}: {sizes[encoding]:>8,} bytes ({served})")
+
+    return sizes['gzip'] < sizes['identity'] and sizes['br'] < sizes['identity']
+
+
+# The shape of the query /api/auctions builds (see get_auctions)
+LISTING_QUERY = """
+    SELECT
+        a.*,
+        ARRAY(SELECT t.tag_name
+              FROM auction_tags at
+              JOIN tags t ON at.tag_id = t.tag_id
+              WHERE at.auction_id = a.auction_id) as tags,
+        (SELECT COUNT(DISTINCT b.user_id)
+         FROM bids b
+         WHERE b.auction_id = a.auction_id) as unique_bidders,
+        (SELECT COUNT(*)
+         FROM bids b
+         WHERE b.auction_id = a.auction_id) as total_bids
+    FROM mv_active_auctions a
+    WHERE a.closes_at > CURRENT_TIMESTAMP
+"""
+
+
+@check('listing-subqueries', 'Listing tag/bid subqueries run only for the rows on the page')
+def check_listing_subqueries(conn):
+    page_size = 5
+    # highest-bid across all states needs a Sort, the case where per-row
+    # subqueries could run for every candidate row instead of one page
+    plan = explain_analyze(conn, LISTING_QUERY + " ORDER BY a.current_bid DESC, a.auction_id ASC LIMIT %s",
+                           (page_size,))
+
+    scanned = max(node['Actual Rows'] for node in plan_nodes(plan)
+                  if node.get('Relation Name') == 'mv_active_auctions')
+    subplans = [node for node in plan_nodes(plan) if node.get('Parent Relationship') == 'SubPlan']
+    print(f"  {scanned} open auctions scanned for a page of {page_size}")
+    for node in subplans:
+        print(f"  {node['Subplan Name']}: ran {node['Actual Loops']} times")
+
+    return len(subplans) == 3 and all(node['Actual Loops'] <= page_size for node in subplans)
+
+
+@check('listing-bid-counts', 'Listing bid counts are answered from idx_bids_auction_user')
+def check_listing_bid_counts(conn):
+    cursor = conn.cursor()
+    cursor.execute("SET LOCAL enable_seqscan = off")
+    cursor.close()
+    plan = explain_analyze(conn, LISTING_QUERY + " ORDER BY a.closes_at ASC, a.auction_id ASC LIMIT 20")
+
+    bid_scans = [node for node in plan_nodes(plan) if node.get('Index Name') == 'idx_bids_auction_user']
+    for node in bid_scans:
+        fetches = f", {node['Heap Fetches']} heap fetches" if 'Heap Fetches' in node else ''
+        print(f"  {node['Node Type']} using idx_bids_auction_user ({node['Actual Loops']} loops{fetches})")
+    # Index Only Scans skip the heap only for pages VACUUM has marked
+    # all-visible; a freshly loaded table shows bitmap/heap scans instead
+    if not any(node['Node Type'] == 'Index Only Scan' for node in bid_scans):
+        print("  (no Index Only Scan - run VACUUM ANALYZE bids and check again)")
+
+    return len(bid_scans) == 2
+
+
+@check('distance-geocoding', 'Distance-filtered listing geocodes each location once per request')
+def check_distance_geocoding(conn):
+    from collections import Counter
+    from unittest import mock
+    from geocoding_helper import SimpleGeocoder
+
+    user_zipcode = '95814'
+    page_size = 100
+
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT COUNT(*) as rows,
+               COUNT(DISTINCT (zip_code, city, state)) as locations
+        FROM (
+            SELECT zip_code, city, state, latitude
+            FROM mv_active_auctions
+            WHERE closes_at > CURRENT_TIMESTAMP
+            ORDER BY closes_at ASC, auction_id ASC
+            LIMIT %s
+        ) page
+        WHERE latitude IS NULL
+    """, (page_size,))
+    expected = cursor.fetchone()
+    cursor.close()
+
+    # Count geocoder calls; lookups that miss the cache get fixed
+    # coordinates instead of going to Nominatim
+    calls = Counter()
+    geocode_zipcode = SimpleGeocoder.geocode_zipcode
+    geocode_city_state = SimpleGeocoder.geocode_city_state
+
+    def count_zipcode(self, zipcode):
+        calls[('zipcode', zipcode)] += 1
+        return geocode_zipcode(self, zipcode)
+
+    def count_city_state(self, city, state):
+        calls[('city_state', city, state)] += 1
+        return geocode_city_state(self, city, state)
+
+    with mock.patch.object(SimpleGeocoder, 'geocode_zipcode', count_zipcode), \
+            mock.patch.object(SimpleGeocoder, 'geocode_city_state', count_city_state), \
+            mock.patch.object(SimpleGeocoder, '_fetch_and_cache', lambda self, *args, **kwargs: (38.58, -121.49)):
+        response = api_client().get(f'/api/auctions?zipcode={user_zipcode}&limit={page_size}')
+
+    if response.status_code != 200:
+        print(f"  /api/auctions returned {response.status_code}: {response.get_json()}")
+        return False
+
+    calls[('zipcode', user_zipcode)] -= 1  # the user's own location
+    lookups = sum(calls.values())
+    repeated = [key for key, count in calls.items() if count > 1]
+    print(f"  {expected['rows']} rows without coordinates, {expected['locations']} distinct locations")
+    print(f"  {lookups} geocoder lookups for those rows, {len(repeated)} locations looked up twice")
+    return not repeated
+
+
+# ============================================================================
+# Main
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description='Reproduce performance measurements')
+    parser.add_argument('checks', nargs='*', help='Checks to run (default: all)')
+    parser.add_argument('--list', action='store_true', help='List the available checks')
+    args = parser.parse_args()
+
+    if args.list:
+        for name, (_, description) in CHECKS.items():
+            print(f"{name:24} {description}")
+        return
+
+    unknown = [name for name in args.checks if name not in CHECKS]
+    if unknown:
+        parser.error(f"Unknown check(s): {', '.join(unknown)} (see --list)")
+
+    conn = get_db_connection()
+    failed = []
+    try:
+        for name in args.checks or CHECKS:
+            func, description = CHECKS[name]
+            print(f"{name}: {description}")
+            passed = func(conn)
+            conn.rollback()
+            print(f"  {'✓ ok' if passed else '✗ FAILED'}\n")
+            if not passed:
+                failed.append(name)
+    finally:
+        conn.close()
+
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,9 @@
 -- Enable UUID extension (PostgreSQL)
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
+-- Trigram indexes for unanchored ILIKE search
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- ============================================================================
 -- USERS TABLE
 -- ============================================================================
@@ -24,6 +27,7 @@ CREATE TABLE users (
 -- Indexes for users table
 CREATE INDEX idx_email ON users(email);
 CREATE INDEX idx_username ON users(username);
+CREATE INDEX idx_users_created_id ON users(created_at DESC, user_id DESC); -- Admin user list paging
 
 -- ============================================================================
 -- PROVIDERS TABLE (Storage Companies)
@@ -57,6 +61,49 @@ CREATE TABLE providers (
 CREATE INDEX idx_providers_state ON providers(state);
 CREATE INDEX idx_providers_city_state ON providers(city, state);
 CREATE INDEX idx_providers_active ON providers(is_active);
+CREATE INDEX idx_providers_active_state ON providers(is_active, state);
+
+-- ============================================================================
+-- FACILITIES TABLE (Physical storage locations, from add_facilities_table.sql)
+-- ============================================================================
+CREATE TABLE facilities (
+    facility_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    provider_id UUID NOT NULL,
+
+    -- Facility identification
+    facility_name VARCHAR(255) NOT NULL,
+
+    -- Full address information
+    address_line1 VARCHAR(255),
+    address_line2 VARCHAR(255),
+    city VARCHAR(100) NOT NULL,
+    state VARCHAR(2) NOT NULL,
+    zip_code VARCHAR(10),
+
+    -- Geolocation
+    latitude DECIMAL(10, 8),
+    longitude DECIMAL(11, 8),
+
+    -- Contact info
+    phone VARCHAR(20),
+    email VARCHAR(255),
+
+    -- Metadata
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_active BOOLEAN DEFAULT TRUE,
+
+    FOREIGN KEY (provider_id) REFERENCES providers(provider_id) ON DELETE CASCADE,
+
+    -- Ensure unique facility per provider by name+city+state combination
+    UNIQUE(provider_id, facility_name, city, state)
+);
+
+-- Indexes for facilities table
+CREATE INDEX idx_facilities_provider ON facilities(provider_id);
+CREATE INDEX idx_facilities_city_state ON facilities(city, state);
+CREATE INDEX idx_facilities_location ON facilities(latitude, longitude);
+CREATE INDEX idx_facilities_lookup ON facilities(provider_id, facility_name, city, state);
 
 -- ============================================================================
 -- AUCTIONS TABLE
@@ -107,15 +154,23 @@ CREATE TABLE auctions (
     last_scraped_at TIMESTAMP,
     
     -- Images (stored as JSON array of URLs)
-    image_urls JSON,
+    image_urls JSONB,
     
     -- AI Image Analysis
     ai_description TEXT, -- AI-generated description of unit contents
     ai_analyzed_at TIMESTAMP, -- When AI analysis was performed
     ai_confidence_score DECIMAL(3, 2), -- Confidence score from AI (0.00 to 1.00)
 
+    -- From add_facilities_table.sql and add_fullness_rating.sql
+    facility_id UUID, -- NULL until the auction is re-scraped
+    fullness_rating INT, -- AI-estimated fullness: 1 (nearly empty) to 5 (very full)
+
     FOREIGN KEY (provider_id) REFERENCES providers(provider_id) ON DELETE CASCADE,
-    FOREIGN KEY (winner_user_id) REFERENCES users(user_id) ON DELETE SET NULL
+    FOREIGN KEY (winner_user_id) REFERENCES users(user_id) ON DELETE SET NULL,
+    CONSTRAINT fk_auctions_facility
+        FOREIGN KEY (facility_id) REFERENCES facilities(facility_id) ON DELETE SET NULL,
+    CONSTRAINT check_fullness_rating
+        CHECK (fullness_rating IS NULL OR (fullness_rating >= 1 AND fullness_rating <= 5))
 );
 
 -- Indexes for auctions table
@@ -126,6 +181,20 @@ CREATE INDEX idx_auctions_state ON auctions(state);
 CREATE INDEX idx_auctions_city_state ON auctions(city, state);
 CREATE INDEX idx_auctions_location ON auctions(latitude, longitude);
 CREATE INDEX idx_auctions_active_auctions ON auctions(status, closes_at); -- For finding open auctions
+CREATE INDEX idx_auctions_provider_external_id ON auctions(provider_id, external_auction_id); -- Scraper upserts
+CREATE INDEX idx_auctions_provider_active ON auctions(provider_id) WHERE status = 'active';
+CREATE INDEX idx_auctions_facility ON auctions(facility_id);
+CREATE INDEX idx_auctions_facility_active ON auctions(facility_id) WHERE status = 'active';
+CREATE INDEX idx_auctions_fullness ON auctions(fullness_rating) WHERE fullness_rating IS NOT NULL;
+
+-- Listing and search (partial indexes over open auctions only)
+CREATE INDEX idx_auctions_active_state_closes ON auctions(state, closes_at) WHERE status = 'active';
+CREATE INDEX idx_auctions_active_state_bid ON auctions(state, current_bid DESC) WHERE status = 'active';
+CREATE INDEX idx_auctions_active_closes_id ON auctions(closes_at, auction_id) WHERE status = 'active'; -- Search keyset paging
+CREATE INDEX idx_auctions_active_city_closes_id ON auctions(city, closes_at, auction_id) WHERE status = 'active';
+CREATE INDEX idx_auctions_active_bid ON auctions(current_bid) WHERE status = 'active';
+CREATE INDEX idx_auctions_desc_trgm ON auctions USING GIN (description gin_trgm_ops);
+CREATE INDEX idx_auctions_unit_trgm ON auctions USING GIN (unit_number gin_trgm_ops);
 
 -- ============================================================================
 -- AUCTION_TAGS TABLE
@@ -168,6 +237,7 @@ CREATE TABLE auction_tags (
 CREATE INDEX idx_auction_tags_auction ON auction_tags(auction_id);
 CREATE INDEX idx_auction_tags_tag ON auction_tags(tag_id);
 CREATE INDEX idx_auction_tags_source ON auction_tags(source);
+CREATE INDEX idx_auction_tags_tag_auction ON auction_tags(tag_id, auction_id);
 
 -- ============================================================================
 -- BIDS TABLE
@@ -201,6 +271,9 @@ CREATE INDEX idx_bids_user ON bids(user_id);
 CREATE INDEX idx_bids_auction_user ON bids(auction_id, user_id);
 CREATE INDEX idx_bids_bid_time ON bids(bid_time);
 CREATE INDEX idx_bids_winning ON bids(is_winning);
+CREATE INDEX idx_bids_auction_winning ON bids(auction_id) WHERE is_winning = TRUE;
+CREATE INDEX idx_bids_auction_time_covering ON bids(auction_id, bid_time DESC)
+    INCLUDE (bid_amount, user_id, is_winning); -- Auction detail bid history
 
 -- ============================================================================
 -- WATCHLIST TABLE (Users can watch auctions)
@@ -244,6 +317,26 @@ CREATE TABLE scrape_logs (
 CREATE INDEX idx_scrape_logs_provider ON scrape_logs(provider_id);
 CREATE INDEX idx_scrape_logs_status ON scrape_logs(status);
 CREATE INDEX idx_scrape_logs_started_at ON scrape_logs(scrape_started_at);
+CREATE INDEX idx_scrape_logs_provider_started ON scrape_logs(provider_id, scrape_started_at DESC);
+
+-- ============================================================================
+-- SCRAPE_JOBS TABLE (Background scrapes started from the API)
+-- ============================================================================
+CREATE TABLE scrape_jobs (
+    job_id UUID PRIMARY KEY,
+    provider_id UUID,
+    dry_run BOOLEAN NOT NULL DEFAULT FALSE,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued', -- queued, running, finished, failed
+    scrape_result JSONB,
+    error TEXT,
+    worker VARCHAR(100), -- host:pid of the process running the job
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+    FOREIGN KEY (provider_id) REFERENCES providers(provider_id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_scrape_jobs_created ON scrape_jobs(created_at);
 
 -- ============================================================================
 -- NOTIFICATIONS TABLE (User notifications)
@@ -276,8 +369,15 @@ CREATE INDEX idx_notifications_created_at ON notifications(created_at);
 
 -- Active auctions with current bid counts and tags
 CREATE VIEW active_auctions_summary AS
-SELECT 
-    a.*,
+SELECT
+    a.auction_id, a.provider_id, a.unit_number, a.unit_size, a.unit_size_sqft,
+    a.description, a.facility_name, a.address_line1, a.address_line2, a.city,
+    a.state, a.zip_code, a.latitude, a.longitude, a.starts_at, a.closes_at,
+    a.closed_at, a.minimum_bid, a.current_bid, a.bid_increment, a.reserve_price,
+    a.status, a.winner_user_id, a.winning_bid, a.created_at, a.updated_at,
+    a.source_url, a.external_auction_id, a.last_scraped_at, a.image_urls,
+    a.ai_description, a.ai_analyzed_at, a.ai_confidence_score, a.facility_id,
+    a.fullness_rating,
     p.name as provider_name,
     COUNT(DISTINCT b.user_id) as unique_bidders,
     COUNT(b.bid_id) as total_bids,
@@ -325,6 +425,69 @@ LEFT JOIN auction_tags at ON t.tag_id = at.tag_id
 GROUP BY t.tag_id, t.tag_name, t.tag_slug
 ORDER BY auction_count DESC;
 
+-- ============================================================================
+-- MATERIALIZED VIEWS
+-- ============================================================================
+-- The API refreshes these in the background (ACTIVE_AUCTIONS_REFRESH_SECONDS,
+-- TAG_COUNTS_REFRESH_SECONDS). mv_active_auctions names its columns (the
+-- same list as AUCTION_COLUMNS in api_backend.py), so a new auctions column
+-- only reaches the listing once it's added to both and the view is rebuilt.
+
+-- Open auctions for the listing endpoint
+CREATE MATERIALIZED VIEW mv_active_auctions AS
+SELECT
+    a.auction_id, a.provider_id, a.unit_number, a.unit_size, a.unit_size_sqft,
+    a.description, a.facility_name, a.address_line1, a.address_line2, a.city,
+    a.state, a.zip_code, a.latitude, a.longitude, a.starts_at, a.closes_at,
+    a.closed_at, a.minimum_bid, a.current_bid, a.bid_increment, a.reserve_price,
+    a.status, a.winner_user_id, a.winning_bid, a.created_at, a.updated_at,
+    a.source_url, a.external_auction_id, a.last_scraped_at, a.image_urls,
+    a.ai_description, a.ai_analyzed_at, a.ai_confidence_score, a.facility_id,
+    a.fullness_rating,
+    p.name as provider_name
+FROM auctions a
+LEFT JOIN providers p ON a.provider_id = p.provider_id
+WHERE a.status = 'active'
+    AND a.closes_at > CURRENT_TIMESTAMP;
+
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX idx_mv_active_auctions_id ON mv_active_auctions(auction_id);
+CREATE INDEX idx_mv_active_auctions_state_closes_id ON mv_active_auctions(state, closes_at, auction_id);
+CREATE INDEX idx_mv_active_auctions_state_bid ON mv_active_auctions(state, current_bid DESC);
+CREATE INDEX idx_mv_active_auctions_desc_trgm ON mv_active_auctions USING GIN (description gin_trgm_ops);
+CREATE INDEX idx_mv_active_auctions_unit_trgm ON mv_active_auctions USING GIN (unit_number gin_trgm_ops);
+
+-- Per-tag auction counts for GET /api/tags
+CREATE MATERIALIZED VIEW mv_tag_counts AS
+SELECT
+    t.*,
+    COUNT(at.auction_id) as auction_count
+FROM tags t
+LEFT JOIN auction_tags at ON t.tag_id = at.tag_id
+GROUP BY t.tag_id;
+
+CREATE UNIQUE INDEX idx_mv_tag_counts_id ON mv_tag_counts(tag_id);
+
+-- Last refresh per view, so each API worker's refresher can skip a cycle
+-- another worker already covered
+CREATE TABLE materialized_view_refreshes (
+    view_name VARCHAR(100) PRIMARY KEY,
+    refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+-- ============================================================================
+-- FULL-TEXT SEARCH
+-- ============================================================================
+-- Only used in WHERE clauses; the API names the columns it returns so the
+-- tsvector never ends up in a response. Requires PostgreSQL 12+.
+ALTER TABLE auctions
+    ADD COLUMN search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(description, '') || ' ' || coalesce(unit_number, ''))
+    ) STORED;
+
+CREATE INDEX idx_auctions_search_tsv ON auctions USING GIN (search_tsv);
+
 -- ============================================================================
 -- TRIGGERS
 -- ============================================================================
@@ -15,6 +15,7 @@ import time
 
 # Configuration
 API_BASE_URL = "http://localhost:5000"  # Change to your API URL
+SCRAPE_POLL_TIMEOUT = 30 * 60  # Seconds to wait for a scrape to finish
 
 def create_provider(provider_data):
     """Create a new provider via API"""
@@ -41,16 +42,37 @@ def trigger_scrape(provider_id, full_scrape=True):
         headers={'Content-Type': 'application/json'}
     )
 
-    if response.status_code == 200:
-        result = response.json()
-        scrape_result = result.get('scrape_result', {})
+    if response.status_code != 202:
+        print(f"✗ Scrape failed: {response.json()}")
+        return None
+
+    # The scrape runs in the background; poll until it finishes
+    job_id = response.json()['job_id']
+    deadline = time.time() + SCRAPE_POLL_TIMEOUT
+    while time.time() < deadline:
+        time.sleep(2)
+        poll = requests.get(f"{API_BASE_URL}/api/scrape/{job_id}")
+        if poll.status_code == 404:
+            print(f"✗ Scrape job {job_id} not found")
+            return None
+        if poll.status_code != 200:
+            continue  # Transient error - keep polling
+        job = poll.json()['job']
+        if job['status'] not in ('queued', 'running'):
+            break
+    else:
+        print(f"✗ Timed out waiting for scrape job {job_id}")
+        return None
+
+    if job['status'] == 'finished':
+        scrape_result = job.get('scrape_result', {})
         print(f"✓ Scrape completed for provider {provider_id}")
         print(f"  Found: {scrape_result.get('auctions_found', 0)}")
         print(f"  Added: {scrape_result.get('auctions_added', 0)}")
         print(f"  Updated: {scrape_result.get('auctions_updated', 0)}")
         return scrape_result
     else:
-        print(f"✗ Scrape failed: {response.json()}")
+        print(f"✗ Scrape failed: {job.get('error')}")
         return None
 
 def get_providers():
@@ -9,19 +9,167 @@ Includes database caching to dramatically improve performance and
 reduce API calls to Nominatim.
 """
 
+import os
 import requests
+import threading
 import time
-from typing import Optional, Tuple
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from math import atan2, cos, pi, sin, sqrt
+from typing import Iterable, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Vectorized distances (optional)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# One HTTP session per process, shared by every SimpleGeocoder, so
+# lookups reuse the open keep-alive connection to Nominatim instead of
+# paying a new TCP + TLS handshake each time
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """Get the shared Nominatim HTTP session, creating it on first use"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                session.headers.update({'User-Agent': 'StorageAuctionPlatform/1.0'})
+                retries = Retry(total=3, backoff_factor=0.5,
+                                status_forcelist=[429, 502, 503, 504])
+                session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                                      max_retries=retries))
+                _http_session = session
+    return _http_session
+
+
+# Coordinates found this process, shared by every SimpleGeocoder (the API
+# builds one per request), so a repeated location skips even the database
+# cache. Least recently used entries are dropped past GEOCODE_MEMO_SIZE.
+GEOCODE_MEMO_SIZE = int(os.getenv('GEOCODE_MEMO_SIZE', 10000))
+_memo = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def _memo_key(location_type: str, location_key: str) -> Tuple[str, str]:
+    """Normalize a cache key so 'Sacramento,CA' and 'sacramento, ca' match"""
+    return (location_type, ''.join(location_key.split()).lower())
+
+
+def _memo_get(location_type: str, location_key: str) -> Optional[Tuple[float, float]]:
+    key = _memo_key(location_type, location_key)
+    with _memo_lock:
+        coords = _memo.get(key)
+        if coords is not None:
+            _memo.move_to_end(key)
+        return coords
+
+
+def _memo_put(location_type: str, location_key: str, coords: Tuple[float, float]):
+    key = _memo_key(location_type, location_key)
+    with _memo_lock:
+        _memo[key] = coords
+        _memo.move_to_end(key)
+        while len(_memo) > GEOCODE_MEMO_SIZE:
+            _memo.popitem(last=False)
+
+
+# Cache hits not yet added to geocoded_locations.hit_count. Counting them
+# here and writing them out in batches keeps cache reads read-only. A
+# failed flush puts its hits back for the next one; counts from a worker
+# that exits before its next flush are lost (hit_count is only a
+# monitoring aid).
+HIT_COUNT_FLUSH_SIZE = 100  # Pending hits that trigger a flush
+HIT_COUNT_FLUSH_INTERVAL = 60  # Seconds after which any pending hits are flushed
+_pending_hits = Counter()
+_pending_hits_total = 0
+_pending_hits_lock = threading.Lock()
+_last_hits_flush = time.monotonic()
+
+
+def _record_hit(location_type: str, location_key: str):
+    global _pending_hits_total
+    with _pending_hits_lock:
+        _pending_hits[(location_type, location_key)] += 1
+        _pending_hits_total += 1
+
+
+def _take_pending_hits() -> dict:
+    """Hand back the pending hits and reset them, if it's time to flush"""
+    global _pending_hits, _pending_hits_total, _last_hits_flush
+    with _pending_hits_lock:
+        if not _pending_hits:
+            return {}
+        if (_pending_hits_total < HIT_COUNT_FLUSH_SIZE
+                and time.monotonic() - _last_hits_flush < HIT_COUNT_FLUSH_INTERVAL):
+            return {}
+        hits, _pending_hits, _pending_hits_total = _pending_hits, Counter(), 0
+        _last_hits_flush = time.monotonic()
+        return hits
+
+
+def _restore_pending_hits(hits: dict):
+    """Put back hits whose flush failed so the next flush retries them"""
+    global _pending_hits_total
+    with _pending_hits_lock:
+        _pending_hits.update(hits)
+        _pending_hits_total += sum(hits.values())
+
+
+# Nominatim lookups currently running in this process, keyed like the memo.
+# A thread that misses the cache while another is already fetching the
+# same location waits for that result instead of sending a duplicate
+# request (and using up another slot of the 1 request/second limit).
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(location_type: str, location_key: str, fetch):
+    """Run fetch() for a location, or wait for the call already in flight"""
+    key = _memo_key(location_type, location_key)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+
+    if not owner:
+        return future.result()
+
+    try:
+        coords = fetch()
+        future.set_result(coords)
+        return coords
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
 
 class SimpleGeocoder:
     """Simple geocoder using OpenStreetMap Nominatim with database caching"""
 
-    def __init__(self, db_connection=None):
+    def __init__(self, db_connection=None, write_connection=None):
         """
         Initialize geocoder with optional database connection for caching
 
         Args:
             db_connection: psycopg2 connection object for cache storage (optional)
+            write_connection: Callable returning a context manager that yields
+                a connection and commits it on exit (e.g. the API's db_conn).
+                Cache writes are then queued until flush_writes(), which the
+                caller runs after releasing db_connection, so it never holds
+                two pooled connections at once. Without it, writes are
+                committed on db_connection as they happen.
         """
         self.base_url = "https://nominatim.openstreetmap.org/search"
         self.headers = {
@@ -30,6 +178,53 @@ class SimpleGeocoder:
         self._last_request_time = 0
         self._min_request_interval = 1.0  # Nominatim requires 1 second between requests
         self.db_connection = db_connection
+        self.write_connection = write_connection
+        # Cache rows loaded up front by prefetch_cache, keyed by
+        # (location_type, location_key)
+        self._prefetched = {}
+        # Locations waiting for flush_writes (write_connection only)
+        self._pending_saves = {}
+
+    def prefetch_cache(self, keys: Iterable[Tuple[str, str]]):
+        """
+        Load many cached locations with one query
+
+        Later geocode_* calls for these keys are answered from memory
+        instead of one cache round trip each.
+
+        Args:
+            keys: (location_type, location_key) pairs, e.g. ('zipcode', '95672')
+        """
+        keys = list({key for key in keys
+                     if key not in self._prefetched and _memo_get(*key) is None})
+        if not self.db_connection or not keys:
+            return
+
+        try:
+            from psycopg2.extras import RealDictCursor, execute_values
+            cursor = self.db_connection.cursor(cursor_factory=RealDictCursor)
+
+            rows = execute_values(cursor, """
+                SELECT g.location_type, g.location_key, g.latitude, g.longitude
+                FROM geocoded_locations g
+                JOIN (VALUES %s) AS k(location_type, location_key)
+                  ON g.location_type = k.location_type
+                 AND g.location_key = k.location_key
+            """, keys, page_size=len(keys), fetch=True)
+            cursor.close()
+
+            # Remember misses too, so they go straight to Nominatim
+            self._prefetched.update(dict.fromkeys(keys))
+            for row in rows:
+                coords = (float(row['latitude']), float(row['longitude']))
+                self._prefetched[(row['location_type'], row['location_key'])] = coords
+                _memo_put(row['location_type'], row['location_key'], coords)
+                _record_hit(row['location_type'], row['location_key'])
+
+            self._flush_hit_counts()
+
+        except Exception as e:
+            print(f"Cache prefetch error: {e}")
 
     def _check_cache(self, location_type: str, location_key: str) -> Optional[Tuple[float, float]]:
         """
@@ -42,6 +237,15 @@ class SimpleGeocoder:
         Returns:
             Tuple of (latitude, longitude) or None if not in cache
         """
+        coords = _memo_get(location_type, location_key)
+        if coords:
+            _record_hit(location_type, location_key)
+            self._flush_hit_counts()
+            return coords
+
+        if (location_type, location_key) in self._prefetched:
+            return self._prefetched[(location_type, location_key)]
+
         if not self.db_connection:
             return None
 
@@ -50,19 +254,20 @@ class SimpleGeocoder:
             cursor = self.db_connection.cursor(cursor_factory=RealDictCursor)
 
             cursor.execute("""
-                UPDATE geocoded_locations
-                SET hit_count = hit_count + 1,
-                    updated_at = CURRENT_TIMESTAMP
+                SELECT latitude, longitude
+                FROM geocoded_locations
                 WHERE location_type = %s AND location_key = %s
-                RETURNING latitude, longitude
             """, (location_type, location_key))
 
             result = cursor.fetchone()
-            self.db_connection.commit()
             cursor.close()
 
             if result:
-                return (float(result['latitude']), float(result['longitude']))
+                coords = (float(result['latitude']), float(result['longitude']))
+                _memo_put(location_type, location_key, coords)
+                _record_hit(location_type, location_key)
+                self._flush_hit_counts()
+                return coords
 
             return None
 
@@ -70,6 +275,86 @@ class SimpleGeocoder:
             print(f"Cache check error: {e}")
             return None
 
+    def flush_writes(self):
+        """
+        Write the queued cache saves and any due hit counts
+
+        Only needed with write_connection; call it once db_connection has
+        been released.
+        """
+        if not self.write_connection:
+            return
+
+        locations, self._pending_saves = self._pending_saves, {}
+        if locations:
+            self._upsert_locations(locations)
+        self._write_hit_counts()
+
+    @contextmanager
+    def _write_cursor(self):
+        """
+        Cursor for a cache write, committed on success, rolled back on error
+
+        Uses write_connection when given, so the caller's transaction on
+        db_connection is never committed or aborted by a cache write.
+        """
+        if self.write_connection:
+            with self.write_connection() as conn, conn.cursor() as cursor:
+                yield cursor
+            return
+
+        try:
+            with self.db_connection.cursor() as cursor:
+                yield cursor
+            self.db_connection.commit()
+        except Exception:
+            self.db_connection.rollback()
+            raise
+
+    def _flush_hit_counts(self):
+        """Add the pending cache hits to hit_count, once enough have built up"""
+        if self.write_connection:
+            return  # Left for flush_writes
+        self._write_hit_counts()
+
+    def _write_hit_counts(self):
+        if not self.db_connection and not self.write_connection:
+            return
+
+        hits = _take_pending_hits()
+        if not hits:
+            return
+
+        try:
+            from psycopg2.extras import execute_values
+            with self._write_cursor() as cursor:
+                # Lock the rows in key order first: concurrent flushes then
+                # queue behind each other instead of deadlocking
+                execute_values(cursor, """
+                    SELECT 1
+                    FROM geocoded_locations g
+                    JOIN (VALUES %s) AS k(location_type, location_key)
+                      ON g.location_type = k.location_type
+                     AND g.location_key = k.location_key
+                    ORDER BY g.location_type, g.location_key
+                    FOR UPDATE OF g
+                """, sorted(hits), page_size=len(hits))
+
+                execute_values(cursor, """
+                    UPDATE geocoded_locations g
+                    SET hit_count = g.hit_count + k.hits,
+                        updated_at = CURRENT_TIMESTAMP
+                    FROM (VALUES %s) AS k(location_type, location_key, hits)
+                    WHERE g.location_type = k.location_type
+                      AND g.location_key = k.location_key
+                """, [(location_type, location_key, count)
+                      for (location_type, location_key), count in hits.items()],
+                    page_size=len(hits))
+
+        except Exception as e:
+            _restore_pending_hits(hits)
+            print(f"Cache hit count error: {e}")
+
     def _save_to_cache(self, location_type: str, location_key: str, lat: float, lon: float):
         """
         Save geocoded location to database cache
@@ -80,25 +365,51 @@ class SimpleGeocoder:
             lat: Latitude
             lon: Longitude
         """
-        if not self.db_connection:
+        self.save_to_cache_many([(location_type, location_key, lat, lon)])
+
+    def save_to_cache_many(self, rows: Iterable[Tuple[str, str, float, float]]):
+        """
+        Save many geocoded locations with one upsert and one commit
+
+        Args:
+            rows: (location_type, location_key, latitude, longitude) tuples
+        """
+        # One row per key - an upsert can't touch the same row twice
+        locations = {(location_type, location_key): (lat, lon)
+                     for location_type, location_key, lat, lon in rows}
+        if not locations:
             return
 
-        try:
-            from psycopg2.extras import RealDictCursor
-            cursor = self.db_connection.cursor(cursor_factory=RealDictCursor)
+        for key, coords in locations.items():
+            _memo_put(*key, coords)
 
-            cursor.execute("""
-                INSERT INTO geocoded_locations (location_type, location_key, latitude, longitude, hit_count)
-                VALUES (%s, %s, %s, %s, 1)
-                ON CONFLICT (location_type, location_key)
-                DO UPDATE SET
-                    latitude = EXCLUDED.latitude,
-                    longitude = EXCLUDED.longitude,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (location_type, location_key, lat, lon))
+            # Keep a prefetched miss from sending this key to Nominatim again
+            if key in self._prefetched:
+                self._prefetched[key] = coords
 
-            self.db_connection.commit()
-            cursor.close()
+        if self.write_connection:
+            self._pending_saves.update(locations)
+        elif self.db_connection:
+            self._upsert_locations(locations)
+
+    def _upsert_locations(self, locations: dict):
+        """Upsert {(location_type, location_key): (lat, lon)} into the cache"""
+        try:
+            from psycopg2.extras import execute_values
+            with self._write_cursor() as cursor:
+                # Rows are inserted (and locked) in key order, so concurrent
+                # saves of overlapping keys can't deadlock
+                execute_values(cursor, """
+                    INSERT INTO geocoded_locations (location_type, location_key, latitude, longitude, hit_count)
+                    VALUES %s
+                    ON CONFLICT (location_type, location_key)
+                    DO UPDATE SET
+                        latitude = EXCLUDED.latitude,
+                        longitude = EXCLUDED.longitude,
+                        updated_at = CURRENT_TIMESTAMP
+                """, [(location_type, location_key, lat, lon)
+                      for (location_type, location_key), (lat, lon) in sorted(locations.items())],
+                    template="(%s, %s, %s, %s, 1)", page_size=500)
 
         except Exception as e:
             print(f"Cache save error: {e}")
@@ -110,6 +421,41 @@ class SimpleGeocoder:
             time.sleep(self._min_request_interval - elapsed)
         self._last_request_time = time.time()
     
+    def _fetch_and_cache(self, location_type: str, location_key: str,
+                         params: dict) -> Optional[Tuple[float, float]]:
+        """
+        Look a location up on Nominatim and cache the result
+
+        Args:
+            location_type: 'zipcode' or 'city_state'
+            location_key: The location identifier
+            params: Nominatim search parameters
+
+        Returns:
+            Tuple of (latitude, longitude) or None if not found
+        """
+        self._rate_limit()
+
+        response = get_http_session().get(
+            self.base_url,
+            params=params,
+            headers=self.headers,
+            timeout=5
+        )
+        response.raise_for_status()
+
+        results = response.json()
+        if results and len(results) > 0:
+            lat = float(results[0]['lat'])
+            lon = float(results[0]['lon'])
+
+            # Save to cache
+            self._save_to_cache(location_type, location_key, lat, lon)
+
+            return (lat, lon)
+
+        return None
+
     def geocode_city_state(self, city: str, state: str) -> Optional[Tuple[float, float]]:
         """
         Geocode a city and state to latitude/longitude
@@ -133,8 +479,6 @@ class SimpleGeocoder:
 
         # Not in cache, make API call
         try:
-            self._rate_limit()
-
             params = {
                 'city': city,
                 'state': state,
@@ -142,26 +486,8 @@ class SimpleGeocoder:
                 'format': 'json',
                 'limit': 1
             }
-
-            response = requests.get(
-                self.base_url,
-                params=params,
-                headers=self.headers,
-                timeout=5
-            )
-            response.raise_for_status()
-
-            results = response.json()
-            if results and len(results) > 0:
-                lat = float(results[0]['lat'])
-                lon = float(results[0]['lon'])
-
-                # Save to cache
-                self._save_to_cache('city_state', location_key, lat, lon)
-
-                return (lat, lon)
-
-            return None
+            return _single_flight('city_state', location_key, lambda: self._fetch_and_cache(
+                'city_state', location_key, params))
 
         except Exception as e:
             print(f"Geocoding error for {city}, {state}: {e}")
@@ -186,40 +512,24 @@ class SimpleGeocoder:
 
         # Not in cache, make API call
         try:
-            self._rate_limit()
-
             params = {
                 'postalcode': zipcode,
                 'country': 'United States',
                 'format': 'json',
                 'limit': 1
             }
-
-            response = requests.get(
-                self.base_url,
-                params=params,
-                headers=self.headers,
-                timeout=5
-            )
-            response.raise_for_status()
-
-            results = response.json()
-            if results and len(results) > 0:
-                lat = float(results[0]['lat'])
-                lon = float(results[0]['lon'])
-
-                # Save to cache
-                self._save_to_cache('zipcode', zipcode, lat, lon)
-
-                return (lat, lon)
-
-            return None
+            return _single_flight('zipcode', zipcode, lambda: self._fetch_and_cache(
+                'zipcode', zipcode, params))
 
         except Exception as e:
             print(f"Geocoding error for zipcode {zipcode}: {e}")
             return None
 
 
+EARTH_RADIUS_MILES = 3959.0
+_RADIANS = pi / 180
+
+
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate distance between two points using Haversine formula
@@ -231,19 +541,44 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in miles
     """
-    from math import radians, sin, cos, sqrt, atan2
-    
-    # Earth's radius in miles
-    R = 3959.0
-    
     # Convert to radians
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-    
-    # Haversine formula
+    lat1 *= _RADIANS
+    lat2 *= _RADIANS
     dlat = lat2 - lat1
-    dlon = lon2 - lon1
+    dlon = (lon2 - lon1) * _RADIANS
+
+    # Haversine formula
     a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
     c = 2 * atan2(sqrt(a), sqrt(1-a))
-    distance = R * c
-    
+    distance = EARTH_RADIUS_MILES * c
+
     return distance
+
+
+# Below this many points the plain loop beats building numpy arrays
+NUMPY_MIN_POINTS = 32
+
+
+def calculate_distances(lat: float, lon: float, points) -> list:
+    """
+    Calculate distances from one point to many using the Haversine formula
+
+    Uses numpy when it's installed (one vectorized pass over all points),
+    otherwise calls calculate_distance for each point.
+
+    Args:
+        lat, lon: Origin coordinates
+        points: Sequence of (latitude, longitude) pairs
+
+    Returns:
+        List of distances in miles, in the same order as points
+    """
+    if np is None or len(points) < NUMPY_MIN_POINTS:
+        return [calculate_distance(lat, lon, p_lat, p_lon) for p_lat, p_lon in points]
+
+    lat1, lon1 = np.radians(lat), np.radians(lon)
+    coords = np.radians(np.asarray(points, dtype=np.float64))
+    lats, lons = coords[:, 0], coords[:, 1]
+
+    a = np.sin((lats - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lats) * np.sin((lons - lon1) / 2) ** 2
+    return (EARTH_RADIUS_MILES * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))).tolist()
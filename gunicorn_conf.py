@@ -0,0 +1,53 @@
+"""
+Gunicorn configuration for the Storage Auction Platform API
+
+Usage:
+    gunicorn -c gunicorn_conf.py api_backend:app
+
+Each worker process runs GUNICORN_THREADS request threads, and each thread
+holds at most one pooled database connection (requests release theirs
+before writing to the geocoding cache), so keep DB_POOL_MAX_CONN at or
+above GUNICORN_THREADS (plus SCRAPE_WORKERS and the view refresher).
+Threads that find the pool empty wait up to DB_POOL_TIMEOUT seconds.
+
+Every worker has its own pool, so the server can open up to
+GUNICORN_WORKERS * DB_POOL_MAX_CONN connections in total; keep that below
+Postgres max_connections (100 by default), leaving room for migrations
+and psql sessions.
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# The API is I/O-bound (Postgres, geocoding), so threads per worker matter
+# more than worker count
+worker_class = 'gthread'
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2))
+threads = int(os.getenv('GUNICORN_THREADS', 8))
+keepalive = 30
+timeout = 120  # Scrape/refetch requests can take a while
+
+# Warn at startup when the worker pools could exceed the database's limit
+DB_MAX_CONNECTIONS = int(os.getenv('DB_MAX_CONNECTIONS', 100))
+_pool_size = int(os.getenv('DB_POOL_MAX_CONN', 12))
+if workers * _pool_size > DB_MAX_CONNECTIONS:
+    print(f"Warning: {workers} workers x DB_POOL_MAX_CONN={_pool_size} can open "
+          f"{workers * _pool_size} connections, more than DB_MAX_CONNECTIONS={DB_MAX_CONNECTIONS}")
+
+# Import the app once in the master so workers fork with it already loaded
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Make sure each worker builds its own pool and background threads"""
+    import api_backend
+    import geocoding_helper
+
+    # Connections and threads don't survive fork; anything created in the
+    # master (e.g. by an import-time request) must not be shared
+    api_backend._db_pool = None
+    api_backend._refresher_started = False
+    api_backend._scrape_executor = None
+    geocoding_helper._http_session = None
@@ -0,0 +1,15 @@
+-- Migration: Index for keyset pagination of /api/auctions
+-- The listing pages by (closes_at, auction_id) within a state and fetches
+-- later pages with WHERE (closes_at, auction_id) > (last_closes_at, last_id).
+-- This index answers that seek directly however deep the page is, and
+-- replaces idx_mv_active_auctions_state_closes (a prefix of it).
+
+CREATE INDEX IF NOT EXISTS idx_mv_active_auctions_state_closes_id
+    ON mv_active_auctions(state, closes_at, auction_id);
+
+DROP INDEX IF EXISTS idx_mv_active_auctions_state_closes;
+
+-- Migration notes:
+-- - Requires add_active_auctions_view.sql
+-- - Like the view's other indexes, this must be recreated if the view is
+--   dropped and recreated
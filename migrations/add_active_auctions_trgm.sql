@@ -0,0 +1,20 @@
+-- Migration: Trigram indexes on the listing view for ?search=
+-- /api/search already uses the full-text search_tsv column and the pg_trgm
+-- indexes on auctions (add_auction_search_tsv.sql, add_auction_search_trgm.sql).
+-- The /api/auctions listing reads mv_active_auctions instead, whose
+-- description/unit_number ILIKE '%term%' filter had no index to use. These
+-- let the planner answer it from the view's own GIN indexes.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_mv_active_auctions_desc_trgm
+    ON mv_active_auctions USING GIN (description gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_mv_active_auctions_unit_trgm
+    ON mv_active_auctions USING GIN (unit_number gin_trgm_ops);
+
+-- Migration notes:
+-- - Requires add_active_auctions_view.sql
+-- - Trigram indexes only help for search terms of 3+ characters
+-- - REFRESH ... CONCURRENTLY maintains these like any other index on the
+--   view; they must be recreated if the view is dropped and recreated
@@ -0,0 +1,40 @@
+-- Migration: Materialized view of open auctions for the listing endpoint
+-- Only a small slice of auctions is active and unexpired at any time. The
+-- listing reads this denser, pre-joined relation instead of filtering the
+-- whole auctions table on every page view.
+--
+-- The API refreshes it every ACTIVE_AUCTIONS_REFRESH_SECONDS (default 30),
+-- so listing bids/closings can lag by up to that long. Auction detail and
+-- bidding always read the auctions table directly.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_active_auctions AS
+SELECT
+    a.auction_id, a.provider_id, a.unit_number, a.unit_size, a.unit_size_sqft,
+    a.description, a.facility_name, a.address_line1, a.address_line2, a.city,
+    a.state, a.zip_code, a.latitude, a.longitude, a.starts_at, a.closes_at,
+    a.closed_at, a.minimum_bid, a.current_bid, a.bid_increment, a.reserve_price,
+    a.status, a.winner_user_id, a.winning_bid, a.created_at, a.updated_at,
+    a.source_url, a.external_auction_id, a.last_scraped_at, a.image_urls,
+    a.ai_description, a.ai_analyzed_at, a.ai_confidence_score, a.facility_id,
+    a.fullness_rating,
+    p.name as provider_name
+FROM auctions a
+LEFT JOIN providers p ON a.provider_id = p.provider_id
+WHERE a.status = 'active'
+    AND a.closes_at > CURRENT_TIMESTAMP;
+
+-- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_active_auctions_id
+    ON mv_active_auctions(auction_id);
+
+CREATE INDEX IF NOT EXISTS idx_mv_active_auctions_state_closes
+    ON mv_active_auctions(state, closes_at);
+
+CREATE INDEX IF NOT EXISTS idx_mv_active_auctions_state_bid
+    ON mv_active_auctions(state, current_bid DESC);
+
+-- Migration notes:
+-- - Manual refresh: REFRESH MATERIALIZED VIEW CONCURRENTLY mv_active_auctions;
+-- - The view names its columns (same list as AUCTION_COLUMNS in
+--   api_backend.py); exposing a new auctions column means adding it to both
+--   and dropping and recreating the view
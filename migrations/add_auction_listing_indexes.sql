@@ -0,0 +1,34 @@
+-- Migration: Add indexes for the auction listing and bidding hot paths
+-- The listing query filters on status = 'active' + state and orders by
+-- closes_at or current_bid; without these Postgres scans and sorts every
+-- auction on each page view.
+
+-- ============================================================================
+-- AUCTION LISTING
+-- ============================================================================
+-- sort=closing-soon (default)
+CREATE INDEX IF NOT EXISTS idx_auctions_active_state_closes
+    ON auctions(state, closes_at)
+    WHERE status = 'active';
+
+-- sort=highest-bid / lowest-bid (scanned forwards or backwards)
+CREATE INDEX IF NOT EXISTS idx_auctions_active_state_bid
+    ON auctions(state, current_bid DESC)
+    WHERE status = 'active';
+
+-- ============================================================================
+-- BIDS
+-- ============================================================================
+-- place_bid marks the current winning bid as outbid
+CREATE INDEX IF NOT EXISTS idx_bids_auction_winning
+    ON bids(auction_id)
+    WHERE is_winning = TRUE;
+
+-- Auction detail shows the latest 20 bids
+CREATE INDEX IF NOT EXISTS idx_bids_auction_time
+    ON bids(auction_id, bid_time DESC);
+
+-- Migration notes:
+-- - run_migration.py applies the file in one transaction, so CONCURRENTLY
+--   can't be used here. On a large production table, run each statement
+--   by hand with CREATE INDEX CONCURRENTLY instead to avoid blocking writes.
@@ -0,0 +1,19 @@
+-- Migration: Add trigram indexes for auction text search
+-- Search uses description/unit_number ILIKE '%term%', which can't use a
+-- btree index and falls back to a sequential scan of auctions. pg_trgm GIN
+-- indexes let Postgres answer unanchored ILIKE from the index instead.
+-- No query changes needed - the planner picks these up automatically.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_auctions_desc_trgm
+    ON auctions USING GIN (description gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_auctions_unit_trgm
+    ON auctions USING GIN (unit_number gin_trgm_ops);
+
+-- Migration notes:
+-- - pg_trgm ships with the standard contrib package (postgresql-contrib)
+-- - Trigram indexes only help for search terms of 3+ characters
+-- - On a large table, build with CREATE INDEX CONCURRENTLY outside a
+--   transaction instead of through run_migration.py
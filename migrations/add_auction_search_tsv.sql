@@ -0,0 +1,18 @@
+-- Migration: Full-text search column for /api/search
+-- Keeps a tsvector of description + unit number up to date automatically
+-- (generated column) so search can use a GIN index instead of scanning
+-- every description with ILIKE. Requires PostgreSQL 12+.
+
+ALTER TABLE auctions
+    ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(description, '') || ' ' || coalesce(unit_number, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_auctions_search_tsv
+    ON auctions USING GIN (search_tsv);
+
+-- Migration notes:
+-- - Adding a stored generated column rewrites the auctions table
+-- - active_auctions_summary and mv_active_auctions name their columns and
+--   don't include search_tsv; API queries only use it in WHERE clauses
@@ -0,0 +1,13 @@
+-- Migration: Index for matching scraped auctions to existing rows
+-- Scrapers look up a whole batch of auctions by (provider_id,
+-- external_auction_id) to decide between INSERT and UPDATE, then update
+-- the existing ones by the same key.
+
+CREATE INDEX IF NOT EXISTS idx_auctions_provider_external_id
+    ON auctions(provider_id, external_auction_id);
+
+-- Migration notes:
+-- - Not UNIQUE: older scrapes may have left duplicate rows behind
+-- - run_migration.py applies the file in one transaction, so CONCURRENTLY
+--   can't be used here. On a large production table, run the statement by
+--   hand with CREATE INDEX CONCURRENTLY instead to avoid blocking writes.
@@ -0,0 +1,34 @@
+-- Migration: Covering indexes for bid history and the provider list
+-- Most of the index set the API relies on already exists (see
+-- add_auction_listing_indexes.sql, add_search_filter_indexes.sql,
+-- add_search_keyset_index.sql, add_provider_active_auctions_index.sql,
+-- add_scrape_logs_latest_index.sql and add_auction_search_trgm.sql).
+-- These fill the remaining gaps.
+
+-- ============================================================================
+-- BIDS
+-- ============================================================================
+-- Auction detail reads the latest 20 bids with only these columns; carrying
+-- them in the index lets Postgres answer it with an index-only scan instead
+-- of visiting a heap page per bid. Supersedes idx_bids_auction_time.
+CREATE INDEX IF NOT EXISTS idx_bids_auction_time_covering
+    ON bids(auction_id, bid_time DESC)
+    INCLUDE (bid_amount, user_id, is_winning);
+
+DROP INDEX IF EXISTS idx_bids_auction_time;
+
+-- ============================================================================
+-- PROVIDERS
+-- ============================================================================
+-- /api/providers filters on is_active and optionally state
+CREATE INDEX IF NOT EXISTS idx_providers_active_state
+    ON providers(is_active, state);
+
+-- Migration notes:
+-- - INCLUDE requires PostgreSQL 11+; b-tree deduplication of repeated
+--   auction_id values needs 13+
+-- - Index-only scans depend on the visibility map, so keep autovacuum
+--   enabled on bids
+-- - run_migration.py applies the file in one transaction, so CONCURRENTLY
+--   can't be used here. On a large production table, run each statement
+--   by hand with CREATE INDEX CONCURRENTLY instead to avoid blocking writes.
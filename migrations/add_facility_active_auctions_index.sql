@@ -0,0 +1,13 @@
+-- Migration: Partial index for per-facility active auction counts
+-- The facility endpoints count each facility's active auctions, and the
+-- bulk cleanup looks for facilities with none. Indexing only active rows
+-- keeps both to an index-only probe of the small active slice.
+
+CREATE INDEX IF NOT EXISTS idx_auctions_facility_active
+    ON auctions(facility_id)
+    WHERE status = 'active';
+
+-- Migration notes:
+-- - run_migration.py applies the file in one transaction, so CONCURRENTLY
+--   can't be used here. On a large production table, run the statement by
+--   hand with CREATE INDEX CONCURRENTLY instead to avoid blocking writes.
@@ -0,0 +1,14 @@
+-- Migration: Partial index for per-provider active auction counts
+-- The provider list and detail endpoints count each provider's active
+-- auctions. Indexing only active rows keeps that count to an index-only
+-- scan over the (small) active slice instead of every auction the
+-- provider has ever listed.
+
+CREATE INDEX IF NOT EXISTS idx_auctions_provider_active
+    ON auctions(provider_id)
+    WHERE status = 'active';
+
+-- Migration notes:
+-- - run_migration.py applies the file in one transaction, so CONCURRENTLY
+--   can't be used here. On a large production table, run the statement by
+--   hand with CREATE INDEX CONCURRENTLY instead to avoid blocking writes.
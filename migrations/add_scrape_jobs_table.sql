@@ -0,0 +1,25 @@
+-- Migration: Track background scrape jobs in the database
+-- POST /api/providers/<id>/scrape runs the scrape on a thread in whichever
+-- gunicorn worker took the request, but the client's status polls can land
+-- on any worker. Keeping job state here lets every worker answer them, and
+-- survives worker restarts (orphaned jobs are then reported as failed).
+
+CREATE TABLE IF NOT EXISTS scrape_jobs (
+    job_id UUID PRIMARY KEY,
+    provider_id UUID REFERENCES providers(provider_id) ON DELETE CASCADE,
+    dry_run BOOLEAN NOT NULL DEFAULT FALSE,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued', -- queued, running, finished, failed
+    scrape_result JSONB,
+    error TEXT,
+    worker VARCHAR(100), -- host:pid of the process running the job
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Old jobs are pruned by age
+CREATE INDEX IF NOT EXISTS idx_scrape_jobs_created ON scrape_jobs(created_at);
+
+-- Migration notes:
+-- - Rows older than SCRAPE_JOB_TTL (1 day) are deleted as new jobs start
+-- - A queued/running job whose worker process has gone, or that has not
+--   finished within SCRAPE_JOB_TIMEOUT, is marked failed when polled
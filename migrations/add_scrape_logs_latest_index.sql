@@ -0,0 +1,7 @@
+-- Migration: Index for "latest scrape per provider" lookups
+-- The provider detail endpoint reads only the most recent scrape_logs row
+-- for a provider; this index turns that into a single index seek instead
+-- of aggregating the provider's whole log history.
+
+CREATE INDEX IF NOT EXISTS idx_scrape_logs_provider_started
+    ON scrape_logs(provider_id, scrape_started_at DESC);
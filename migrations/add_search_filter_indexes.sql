@@ -0,0 +1,25 @@
+-- Migration: Indexes for the /api/search filters
+-- Search always filters status = 'active' and pages by (closes_at,
+-- auction_id) (see add_search_keyset_index.sql). These cover the optional
+-- filters so a filtered page is still read in index order rather than
+-- scanned and sorted.
+
+-- city=...: filter and keyset order from one index
+CREATE INDEX IF NOT EXISTS idx_auctions_active_city_closes_id
+    ON auctions(city, closes_at, auction_id)
+    WHERE status = 'active';
+
+-- min_bid / max_bid on their own
+CREATE INDEX IF NOT EXISTS idx_auctions_active_bid
+    ON auctions(current_bid)
+    WHERE status = 'active';
+
+-- tags=...: find the auctions carrying a tag without touching the heap
+CREATE INDEX IF NOT EXISTS idx_auction_tags_tag_auction
+    ON auction_tags(tag_id, auction_id);
+
+-- Migration notes:
+-- - Check plans with EXPLAIN (ANALYZE, BUFFERS) on representative searches
+-- - run_migration.py applies the file in one transaction, so CONCURRENTLY
+--   can't be used here. On a large production table, run each statement
+--   by hand with CREATE INDEX CONCURRENTLY instead to avoid blocking writes.
@@ -0,0 +1,8 @@
+-- Migration: Index for keyset pagination of /api/search
+-- Search pages are ordered by (closes_at, auction_id) and fetched with
+-- WHERE (closes_at, auction_id) > (last_closes_at, last_id), which this
+-- index answers directly regardless of how deep the page is.
+
+CREATE INDEX IF NOT EXISTS idx_auctions_active_closes_id
+    ON auctions(closes_at, auction_id)
+    WHERE status = 'active';
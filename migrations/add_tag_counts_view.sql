@@ -0,0 +1,23 @@
+-- Migration: Materialized view of per-tag auction counts
+-- GET /api/tags aggregated all of auction_tags on every (uncached) call just
+-- to order tags by popularity. The counts are now precomputed here.
+--
+-- The API refreshes it every TAG_COUNTS_REFRESH_SECONDS (default 300) and
+-- after each scrape, so counts can lag behind tag edits by up to that long.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_tag_counts AS
+SELECT
+    t.*,
+    COUNT(at.auction_id) as auction_count
+FROM tags t
+LEFT JOIN auction_tags at ON t.tag_id = at.tag_id
+GROUP BY t.tag_id;
+
+-- Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_tag_counts_id
+    ON mv_tag_counts(tag_id);
+
+-- Migration notes:
+-- - Manual refresh: REFRESH MATERIALIZED VIEW CONCURRENTLY mv_tag_counts;
+-- - Adding columns to tags requires dropping and recreating this view
+--   (t.* is expanded when the view is created)
@@ -0,0 +1,7 @@
+-- Migration: Index for keyset pagination of /api/users
+-- The admin user list is ordered newest first by (created_at, user_id) and
+-- later pages are fetched with WHERE (created_at, user_id) < (last values),
+-- which this index answers with a single seek however deep the page is.
+
+CREATE INDEX IF NOT EXISTS idx_users_created_id
+    ON users(created_at DESC, user_id DESC);
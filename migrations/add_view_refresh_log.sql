@@ -0,0 +1,14 @@
+-- Migration: Track when each materialized view was last refreshed
+-- Every API worker runs its own view refresher. The refresher records the
+-- refresh time here and skips a cycle if another worker refreshed the view
+-- less than an interval ago, so N workers don't refresh N times as often.
+
+CREATE TABLE IF NOT EXISTS materialized_view_refreshes (
+    view_name VARCHAR(100) PRIMARY KEY,
+    refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+-- Migration notes:
+-- - Required by the API's view refresher; until it is applied the
+--   background refresh logs an error each cycle
+-- - Refreshes after a scrape don't check the interval and always run
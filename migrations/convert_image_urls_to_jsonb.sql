@@ -0,0 +1,80 @@
+-- Migration: Store auctions.image_urls as JSONB
+-- JSONB is stored pre-parsed, so Postgres doesn't re-parse the text on
+-- every read and psycopg2 hands the API a decoded list either way.
+
+-- active_auctions_summary and mv_active_auctions select image_urls, which
+-- pins the column type, so both are dropped and recreated around the change
+DROP VIEW IF EXISTS active_auctions_summary;
+DROP MATERIALIZED VIEW IF EXISTS mv_active_auctions;
+
+ALTER TABLE auctions
+    ALTER COLUMN image_urls TYPE JSONB USING image_urls::jsonb;
+
+CREATE VIEW active_auctions_summary AS
+SELECT
+    a.auction_id, a.provider_id, a.unit_number, a.unit_size, a.unit_size_sqft,
+    a.description, a.facility_name, a.address_line1, a.address_line2, a.city,
+    a.state, a.zip_code, a.latitude, a.longitude, a.starts_at, a.closes_at,
+    a.closed_at, a.minimum_bid, a.current_bid, a.bid_increment, a.reserve_price,
+    a.status, a.winner_user_id, a.winning_bid, a.created_at, a.updated_at,
+    a.source_url, a.external_auction_id, a.last_scraped_at, a.image_urls,
+    a.ai_description, a.ai_analyzed_at, a.ai_confidence_score, a.facility_id,
+    a.fullness_rating,
+    p.name as provider_name,
+    COUNT(DISTINCT b.user_id) as unique_bidders,
+    COUNT(b.bid_id) as total_bids,
+    MAX(b.bid_amount) as highest_bid,
+    STRING_AGG(t.tag_name, ', ') as tags
+FROM auctions a
+LEFT JOIN providers p ON a.provider_id = p.provider_id
+LEFT JOIN bids b ON a.auction_id = b.auction_id
+LEFT JOIN auction_tags at ON a.auction_id = at.auction_id
+LEFT JOIN tags t ON at.tag_id = t.tag_id
+WHERE a.status = 'active' 
+    AND a.closes_at > CURRENT_TIMESTAMP
+GROUP BY a.auction_id, p.name;
+
+-- Same definition and indexes as add_active_auctions_view.sql,
+-- add_active_auctions_keyset_index.sql and add_active_auctions_trgm.sql
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE MATERIALIZED VIEW mv_active_auctions AS
+SELECT
+    a.auction_id, a.provider_id, a.unit_number, a.unit_size, a.unit_size_sqft,
+    a.description, a.facility_name, a.address_line1, a.address_line2, a.city,
+    a.state, a.zip_code, a.latitude, a.longitude, a.starts_at, a.closes_at,
+    a.closed_at, a.minimum_bid, a.current_bid, a.bid_increment, a.reserve_price,
+    a.status, a.winner_user_id, a.winning_bid, a.created_at, a.updated_at,
+    a.source_url, a.external_auction_id, a.last_scraped_at, a.image_urls,
+    a.ai_description, a.ai_analyzed_at, a.ai_confidence_score, a.facility_id,
+    a.fullness_rating,
+    p.name as provider_name
+FROM auctions a
+LEFT JOIN providers p ON a.provider_id = p.provider_id
+WHERE a.status = 'active'
+    AND a.closes_at > CURRENT_TIMESTAMP;
+
+CREATE UNIQUE INDEX idx_mv_active_auctions_id
+    ON mv_active_auctions(auction_id);
+
+CREATE INDEX idx_mv_active_auctions_state_closes_id
+    ON mv_active_auctions(state, closes_at, auction_id);
+
+CREATE INDEX idx_mv_active_auctions_state_bid
+    ON mv_active_auctions(state, current_bid DESC);
+
+CREATE INDEX idx_mv_active_auctions_desc_trgm
+    ON mv_active_auctions USING GIN (description gin_trgm_ops);
+
+CREATE INDEX idx_mv_active_auctions_unit_trgm
+    ON mv_active_auctions USING GIN (unit_number gin_trgm_ops);
+
+-- Migration notes:
+-- - Rewrites the auctions table; run during a quiet period
+-- - Writers that pass json.dumps(...) strings keep working unchanged
+-- - Safe to run before or after add_active_auctions_view.sql; if the
+--   materialized view exists it is rebuilt with all of its indexes
+-- - The views are recreated with the column list from database_schema.sql,
+--   so it doesn't matter whether add_auction_search_tsv.sql ran first;
+--   requires add_facilities_table.sql and add_fullness_rating.sql
+-- - New installs get JSONB and both views from database_schema.sql
@@ -24,7 +24,7 @@ from datetime import datetime
 # Add parent directory to path to import scrapers
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from scrapers import Bid13Scraper, StorageAuctionsScraper
+from scrapers import get_scraper
 
 load_dotenv()
 
@@ -107,13 +107,10 @@ def get_scraper_for_provider(provider_id):
         return None
 
     # Determine scraper type based on URL
-    if 'bid13.com' in source_url:
-        return Bid13Scraper(provider_id, source_url)
-    elif 'storageauctions.com' in source_url:
-        return StorageAuctionsScraper(provider_id)
-    else:
+    scraper = get_scraper(provider_id, source_url)
+    if not scraper:
         print(f"Error: No scraper available for URL: {source_url}")
-        return None
+    return scraper
 
 
 def run_scraper(provider_id, full_scrape=True, dry_run=False):
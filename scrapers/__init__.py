@@ -4,8 +4,46 @@ Storage Auction Scrapers Package
 Provides scrapers for various auction platforms
 """
 
+from urllib.parse import urlparse
+
 from .base_scraper import BaseScraper
 from .bid13_scraper import Bid13Scraper
 from .storageauctions_scraper import StorageAuctionsScraper
 
-__all__ = ['BaseScraper', 'Bid13Scraper', 'StorageAuctionsScraper']
+# Source site domain -> factory(provider_id, source_url) building its scraper
+SCRAPER_REGISTRY = {
+    'bid13.com': lambda provider_id, source_url: Bid13Scraper(provider_id, source_url),
+    'storageauctions.com': lambda provider_id, source_url: StorageAuctionsScraper(provider_id),
+}
+
+
+def get_scraper(provider_id, source_url):
+    """
+    Build the scraper for a provider based on its source URL's host
+
+    Matches the host and then each parent domain against SCRAPER_REGISTRY,
+    so www.bid13.com and bid13.com both resolve to Bid13Scraper.
+
+    Args:
+        provider_id: Provider UUID
+        source_url: Provider's source_url
+
+    Returns:
+        Scraper instance, or None if no scraper handles that site
+    """
+    if not source_url:
+        return None
+
+    # urlparse only finds the host when the URL has a scheme or leading //
+    url = source_url if '//' in source_url else '//' + source_url
+    host = (urlparse(url).hostname or '').lower()
+
+    labels = host.split('.')
+    for i in range(len(labels) - 1):
+        factory = SCRAPER_REGISTRY.get('.'.join(labels[i:]))
+        if factory:
+            return factory(provider_id, source_url)
+    return None
+
+
+__all__ = ['BaseScraper', 'Bid13Scraper', 'StorageAuctionsScraper', 'SCRAPER_REGISTRY', 'get_scraper']
@@ -9,7 +9,7 @@ Provides common functionality for all auction site scrapers including:
 """
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 from datetime import datetime
 from typing import List, Dict, Optional
 import os
@@ -58,6 +58,33 @@ class BaseScraper:
 
         return exists
 
+    def existing_auction_ids(self, external_auction_ids: List[str]) -> set:
+        """
+        Find which of a batch of auctions already exist in the database
+
+        Args:
+            external_auction_ids: Auction IDs from the external site
+
+        Returns:
+            Set of the given external IDs that are already saved
+        """
+        if not external_auction_ids:
+            return set()
+
+        conn = self.get_db_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            SELECT DISTINCT external_auction_id FROM auctions
+            WHERE provider_id = %s AND external_auction_id = ANY(%s)
+        """, (self.provider_id, list(external_auction_ids)))
+
+        existing = {row['external_auction_id'] for row in cursor.fetchall()}
+        cursor.close()
+        conn.close()
+
+        return existing
+
     def get_or_create_facility(self, facility_data: Dict) -> Optional[str]:
         """
         Get existing facility or create new one
@@ -275,6 +302,158 @@ class BaseScraper:
             conn.close()
             return None
 
+    def save_auctions(self, auctions: List[Dict]) -> Dict:
+        """
+        Save or update a batch of auctions in one transaction
+
+        Same field handling as save_auction(), but new auctions go in with a
+        single multi-row INSERT and existing ones with a single UPDATE ...
+        FROM (VALUES ...), instead of a connection and two or three
+        statements per auction.
+
+        If the batch fails (e.g. one auction has a malformed date or bid),
+        it is rolled back and the auctions are saved one at a time with
+        save_auction(), so only the bad rows are skipped.
+
+        Args:
+            auctions: List of auction dictionaries
+
+        Returns:
+            Dictionary with 'added', 'updated' and 'failed' counts
+        """
+        # Validate required fields; later duplicates of an ID win
+        valid = {}
+        for auction_data in auctions:
+            if not auction_data.get('closes_at'):
+                print(f"Warning: Skipping auction {auction_data.get('external_auction_id')} - missing required field: closes_at")
+                continue
+            if not auction_data.get('external_auction_id'):
+                print("Warning: Skipping auction - missing external_auction_id")
+                continue
+            valid[auction_data['external_auction_id']] = auction_data
+
+        if not valid:
+            return {'added': 0, 'updated': 0, 'failed': 0}
+
+        existing = self.existing_auction_ids(list(valid))
+        updates = [a for ext_id, a in valid.items() if ext_id in existing]
+        inserts = [a for ext_id, a in valid.items() if ext_id not in existing]
+
+        conn = self.get_db_connection()
+        cursor = conn.cursor()
+
+        try:
+            if updates:
+                execute_values(cursor, """
+                    UPDATE auctions SET
+                        unit_number = v.unit_number,
+                        unit_size = v.unit_size,
+                        description = v.description,
+                        facility_id = v.facility_id,
+                        facility_name = v.facility_name,
+                        city = v.city,
+                        state = v.state,
+                        zip_code = v.zip_code,
+                        closes_at = v.closes_at,
+                        current_bid = v.current_bid,
+                        minimum_bid = v.minimum_bid,
+                        source_url = v.source_url,
+                        last_scraped_at = CURRENT_TIMESTAMP,
+                        updated_at = CURRENT_TIMESTAMP
+                    FROM (VALUES %s) AS v (
+                        provider_id, external_auction_id, unit_number, unit_size,
+                        description, facility_id, facility_name, city, state,
+                        zip_code, closes_at, current_bid, minimum_bid, source_url
+                    )
+                    WHERE auctions.provider_id = v.provider_id
+                      AND auctions.external_auction_id = v.external_auction_id
+                """, [(
+                    self.provider_id,
+                    a.get('external_auction_id'),
+                    a.get('unit_number', 'N/A'),
+                    a.get('unit_size'),
+                    a.get('description', ''),
+                    a.get('facility_id'),
+                    a.get('facility_name'),
+                    a.get('city', 'Unknown'),
+                    a.get('state', 'CA'),
+                    a.get('zip_code', '00000'),
+                    a.get('closes_at'),
+                    a.get('current_bid', 0),
+                    a.get('minimum_bid', 0),
+                    a.get('source_url')
+                ) for a in updates],
+                    template="(%s::uuid, %s, %s, %s, %s, %s::uuid, %s, %s, %s, %s, %s::timestamp, %s::numeric, %s::numeric, %s)",
+                    page_size=500)
+
+            if inserts:
+                execute_values(cursor, """
+                    INSERT INTO auctions (
+                        provider_id,
+                        unit_number,
+                        unit_size,
+                        description,
+                        facility_id,
+                        facility_name,
+                        address_line1,
+                        city,
+                        state,
+                        zip_code,
+                        starts_at,
+                        closes_at,
+                        minimum_bid,
+                        current_bid,
+                        bid_increment,
+                        status,
+                        source_url,
+                        external_auction_id,
+                        last_scraped_at
+                    ) VALUES %s
+                """, [(
+                    self.provider_id,
+                    a.get('unit_number', 'N/A'),
+                    a.get('unit_size'),
+                    a.get('description', ''),
+                    a.get('facility_id'),
+                    a.get('facility_name', ''),
+                    a.get('address_line1', ''),
+                    a.get('city', 'Unknown'),
+                    a.get('state', 'CA'),
+                    a.get('zip_code', '00000'),
+                    a.get('starts_at', datetime.now()),
+                    a.get('closes_at'),
+                    a.get('minimum_bid', 0),
+                    a.get('current_bid', 0),
+                    a.get('bid_increment', 25.00),
+                    'active',
+                    a.get('source_url'),
+                    a.get('external_auction_id')
+                ) for a in inserts],
+                    template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)",
+                    page_size=500)
+
+            conn.commit()
+            cursor.close()
+            conn.close()
+
+            return {'added': len(inserts), 'updated': len(updates), 'failed': 0}
+
+        except Exception as e:
+            print(f"Error saving auction batch, saving one at a time: {e}")
+            conn.rollback()
+            cursor.close()
+            conn.close()
+
+        saved = {'added': 0, 'updated': 0, 'failed': 0}
+        for ext_id, auction_data in valid.items():
+            if self.save_auction(auction_data) is None:
+                saved['failed'] += 1
+            elif ext_id in existing:
+                saved['updated'] += 1
+            else:
+                saved['added'] += 1
+        return saved
+
     def scrape_all(self) -> List[Dict]:
         """
         Scrape all auctions from the site
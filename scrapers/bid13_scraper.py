@@ -454,8 +454,9 @@ class Bid13Scraper(BaseScraper):
             # If dry run, just return the data without saving
             if dry_run:
                 # Check which would be added vs updated
+                existing = self.existing_auction_ids([a['external_auction_id'] for a in auctions])
                 for auction_data in auctions:
-                    if self.auction_exists(auction_data['external_auction_id']):
+                    if auction_data['external_auction_id'] in existing:
                         auctions_updated += 1
                     else:
                         auctions_added += 1
@@ -474,17 +475,17 @@ class Bid13Scraper(BaseScraper):
                     'auctions': auctions  # Include actual auction data for preview
                 }
 
-            # Normal mode: save to database
-            for auction_data in auctions:
-                if self.auction_exists(auction_data['external_auction_id']):
-                    self.save_auction(auction_data)
-                    auctions_updated += 1
-                else:
-                    self.save_auction(auction_data)
-                    auctions_added += 1
-
-            # Log the scrape
-            self.log_scrape('success', auctions_found, auctions_added, auctions_updated)
+            # Normal mode: save to database in one batch
+            saved = self.save_auctions(auctions)
+            auctions_added = saved['added']
+            auctions_updated = saved['updated']
+
+            # Log the scrape ('partial' if some auctions couldn't be saved)
+            if saved['failed']:
+                self.log_scrape('partial', auctions_found, auctions_added, auctions_updated,
+                                f"{saved['failed']} auctions failed to save")
+            else:
+                self.log_scrape('success', auctions_found, auctions_added, auctions_updated)
 
             print(f"Scraping complete: {auctions_found} found, {auctions_added} added, {auctions_updated} updated")
             print(f"Facilities found: {len(unique_facilities)}")
@@ -0,0 +1,620 @@
+"""
+Unit tests for the REST API
+
+Runs without a database: db_conn is swapped for FakeConnection, which
+records the SQL it is sent and hands back canned rows.
+"""
+
+import pytest
+import json
+import os
+import sys
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime
+from decimal import Decimal
+
+from psycopg2.errors import FeatureNotSupported
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+from werkzeug.exceptions import BadRequest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api_backend
+from api_backend import app, jsonify, User
+
+
+class FakeCursor:
+    """Cursor that records statements and returns the connection's rows"""
+
+    def __init__(self, conn):
+        self.connection = conn
+        self.itersize = None
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.connection.executed.append((query, params))
+        if self.connection.error:
+            raise self.connection.error
+        if self.connection.fail_next and query.startswith(self.connection.fail_next[0][0]):
+            raise self.connection.fail_next.pop(0)[1]
+        self.connection.in_transaction = True
+        self._rows = list(self.connection.rows)
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchmany(self, size):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """Stand-in for a pooled connection"""
+
+    def __init__(self):
+        self.rows = []
+        self.error = None
+        self.executed = []
+        self.prepared_statements = OrderedDict()
+        self.closed = False
+        self.checked_out = 0
+        # (statement prefix, exception) pairs raised once each, in order
+        self.fail_next = []
+        self.in_transaction = False
+        self.rollbacks = 0
+
+    def cursor(self, name=None, **kwargs):
+        return FakeCursor(self)
+
+    def get_transaction_status(self):
+        return TRANSACTION_STATUS_INTRANS if self.in_transaction else TRANSACTION_STATUS_IDLE
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    """Route every db_conn() in the API to one FakeConnection"""
+    conn = FakeConnection()
+
+    @contextmanager
+    def db_conn():
+        conn.checked_out += 1
+        try:
+            yield conn
+        finally:
+            conn.checked_out -= 1
+
+    monkeypatch.setattr(api_backend, 'db_conn', db_conn)
+    monkeypatch.setattr(api_backend, '_cache', None)
+    # Keep the background view refresher from starting
+    monkeypatch.setattr(api_backend, '_refresher_started', True)
+    return conn
+
+
+@pytest.fixture
+def client(fake_db):
+    """Flask test client backed by the fake database"""
+    return app.test_client()
+
+
+def provider_row(name):
+    return {'provider_id': uuid.uuid4(), 'name': name, 'created_at': datetime(2026, 1, 2, 3, 4, 5)}
+
+
+class TestStreamJsonRows:
+    """Tests for streaming query results through a server-side cursor"""
+
+    def test_streams_all_batches(self, fake_db, monkeypatch):
+        monkeypatch.setattr(api_backend, 'STREAM_ITERSIZE', 2)
+        fake_db.rows = [provider_row(f'Provider {i}') for i in range(5)]
+
+        with app.test_request_context('/'):
+            response = api_backend.stream_json_rows('SELECT 1', [], 'providers', 'test_stream')
+            body = json.loads(b''.join(response.response))
+
+        assert body['success'] is True
+        assert body['count'] == 5
+        assert [p['name'] for p in body['providers']] == [f'Provider {i}' for i in range(5)]
+        # UUIDs and datetimes are encoded by dump_json
+        assert body['providers'][0]['provider_id'] == str(fake_db.rows[0]['provider_id'])
+        assert body['providers'][0]['created_at'] == '2026-01-02T03:04:05'
+
+    def test_connection_released_after_streaming(self, fake_db):
+        fake_db.rows = [provider_row('A')]
+
+        with app.test_request_context('/'):
+            response = api_backend.stream_json_rows('SELECT 1', [], 'providers', 'test_stream')
+            assert fake_db.checked_out == 1
+            b''.join(response.response)
+
+        assert fake_db.checked_out == 0
+
+    def test_next_cursor_from_last_row(self, fake_db):
+        fake_db.rows = [provider_row('A'), provider_row('B')]
+
+        with app.test_request_context('/'):
+            response = api_backend.stream_json_rows(
+                'SELECT 1', [], 'providers', 'test_stream',
+                next_cursor=lambda last_row, count: {'after': last_row['name'], 'count': count})
+            body = json.loads(b''.join(response.response))
+
+        assert body['next_cursor'] == {'after': 'B', 'count': 2}
+
+    def test_query_error_becomes_json_500(self, client, fake_db):
+        fake_db.error = RuntimeError('relation does not exist')
+
+        response = client.get('/api/providers')
+
+        assert response.status_code == 500
+        assert response.get_json()['success'] is False
+        assert fake_db.checked_out == 0
+
+    def test_cached_body_has_same_etag_as_cache_hit(self, client, fake_db, monkeypatch):
+        fakeredis = pytest.importorskip('fakeredis')
+        monkeypatch.setattr(api_backend, '_cache', fakeredis.FakeRedis(decode_responses=True))
+        fake_db.rows = [provider_row('A')]
+
+        miss = client.get('/api/providers')
+        hit = client.get('/api/providers')
+
+        assert miss.status_code == hit.status_code == 200
+        assert miss.headers['ETag'] == hit.headers['ETag']
+        assert client.get('/api/providers', headers={'If-None-Match': miss.headers['ETag']}).status_code == 304
+
+
+class TestLoadUser:
+    """Tests for rebuilding the logged-in user from session claims"""
+
+    USER_ID = '6f1c2b1e-0000-4000-8000-000000000001'
+
+    def claims(self, **overrides):
+        claims = {'user_id': self.USER_ID, 'username': 'alice', 'email': 'alice@example.com',
+                  'role': 'power', 'checked_at': time.time()}
+        claims.update(overrides)
+        return claims
+
+    def user_row(self, **overrides):
+        row = {'user_id': uuid.UUID(self.USER_ID), 'username': 'alice', 'email': 'alice@example.com',
+               'role': 'admin', 'is_active': True}
+        row.update(overrides)
+        return row
+
+    def test_fresh_claims_skip_database(self, fake_db, monkeypatch):
+        def no_db():
+            raise AssertionError('load_user should not query the database')
+        monkeypatch.setattr(api_backend, 'db_conn', no_db)
+
+        with app.test_request_context('/'):
+            api_backend.session['user_claims'] = self.claims()
+            user = api_backend.load_user(self.USER_ID)
+
+        assert user.id == self.USER_ID
+        assert user.username == 'alice'
+        assert user.role == 'power'
+        assert user.is_active
+
+    def test_stale_claims_revalidate(self, fake_db):
+        fake_db.rows = [self.user_row()]
+        stale = time.time() - api_backend.USER_SESSION_REVALIDATE_SECONDS - 1
+
+        with app.test_request_context('/'):
+            api_backend.session['user_claims'] = self.claims(checked_at=stale)
+            user = api_backend.load_user(self.USER_ID)
+            refreshed = api_backend.session['user_claims']
+
+        assert len(fake_db.executed) > 0
+        # Role change in the database is picked up and saved back to the session
+        assert user.role == 'admin'
+        assert refreshed['role'] == 'admin'
+        assert refreshed['checked_at'] > stale
+
+    def test_claims_for_other_user_ignored(self, fake_db):
+        fake_db.rows = [self.user_row()]
+
+        with app.test_request_context('/'):
+            api_backend.session['user_claims'] = self.claims(user_id='someone-else')
+            user = api_backend.load_user(self.USER_ID)
+
+        assert len(fake_db.executed) > 0
+        assert user.id == self.USER_ID
+
+    def test_deactivated_user_drops_claims(self, fake_db):
+        fake_db.rows = [self.user_row(is_active=False)]
+
+        with app.test_request_context('/'):
+            user = api_backend.load_user(self.USER_ID)
+            assert 'user_claims' not in api_backend.session
+
+        assert not user.is_active
+
+    def test_remember_user_claims_round_trip(self, fake_db, monkeypatch):
+        with app.test_request_context('/'):
+            api_backend.remember_user_claims(User(self.USER_ID, 'bob', 'bob@example.com', 'regular'))
+            monkeypatch.setattr(api_backend, 'db_conn', None)
+            user = api_backend.load_user(self.USER_ID)
+
+        assert (user.username, user.email, user.role) == ('bob', 'bob@example.com', 'regular')
+
+
+def auction_row(closes_at):
+    return {'auction_id': uuid.uuid4(), 'closes_at': closes_at, 'state': 'CA', 'current_bid': 100,
+            'tags': [], 'image_urls': [], 'unique_bidders': 0, 'total_bids': 0}
+
+
+class TestAuctionPagination:
+    """Tests for keyset cursors and the offset cap on the auction listing"""
+
+    def executed_listing(self, fake_db):
+        """Return the PREPAREd listing SQL and the EXECUTE params"""
+        prepare = [q for q, _ in fake_db.executed if q.startswith('PREPARE list_auctions')]
+        execute = [p for q, p in fake_db.executed if q.startswith('EXECUTE list_auctions')]
+        return prepare[-1], execute[-1]
+
+    def test_offset_cap(self, client, fake_db):
+        response = client.get(f'/api/auctions?offset={api_backend.MAX_LISTING_OFFSET + 1}')
+        assert response.status_code == 400
+        assert response.get_json()['success'] is False
+        assert fake_db.executed == []
+
+        assert client.get(f'/api/auctions?offset={api_backend.MAX_LISTING_OFFSET}').status_code == 200
+
+    def test_cursor_requires_both_fields(self, client, fake_db):
+        response = client.get('/api/auctions?after_closes_at=2026-01-01T00:00:00')
+        assert response.status_code == 400
+        assert response.get_json()['success'] is False
+
+    def test_cursor_rejected_for_other_sorts(self, client, fake_db):
+        after_id = uuid.uuid4()
+        response = client.get(f'/api/auctions?sort=highest-bid&after_closes_at=2026-01-01T00:00:00&after_id={after_id}')
+        assert response.status_code == 400
+        response = client.get(f'/api/auctions?zipcode=94103&after_closes_at=2026-01-01T00:00:00&after_id={after_id}')
+        assert response.status_code == 400
+        assert fake_db.executed == []
+
+    def test_partial_page_has_no_cursor(self, client, fake_db):
+        fake_db.rows = [auction_row(datetime(2026, 3, 1, 12, 0))]
+
+        body = client.get('/api/auctions?limit=2').get_json()
+
+        assert body['count'] == 1
+        assert body['next_cursor'] is None
+
+    def test_cursor_round_trip(self, client, fake_db):
+        fake_db.rows = [auction_row(datetime(2026, 3, 1, 12, 0)),
+                        auction_row(datetime(2026, 3, 1, 12, 30, 15, 123456))]
+        last = fake_db.rows[-1]
+
+        first_page = client.get('/api/auctions?limit=2').get_json()
+        next_cursor = first_page['next_cursor']
+        assert next_cursor is not None
+        query, params = self.executed_listing(fake_db)
+        assert '(a.closes_at, a.auction_id) >' not in query
+
+        fake_db.rows = []
+        response = client.get('/api/auctions', query_string={'limit': 2, **next_cursor})
+        assert response.status_code == 200
+        query, params = self.executed_listing(fake_db)
+
+        # The cursor seeks past the last row, to the microsecond
+        assert '(a.closes_at, a.auction_id) > ($2::timestamp, $3::uuid)' in query
+        assert datetime.fromisoformat(params[1]) == last['closes_at']
+        assert uuid.UUID(params[2]) == last['auction_id']
+        assert response.get_json()['next_cursor'] is None
+
+
+class TestStaticFiles:
+    """Tests for static file cache headers"""
+
+    @pytest.fixture
+    def static_dir(self, tmp_path, monkeypatch):
+        (tmp_path / 'app.jsx').write_text('const App = () => null;')
+        (tmp_path / 'app.3f9a1c2b.js').write_text('console.log(1);')
+        monkeypatch.setattr(app, 'root_path', str(tmp_path))
+        monkeypatch.setattr(api_backend, 'STATIC_ACCEL_REDIRECT', None)
+        return tmp_path
+
+    def test_plain_file_gets_short_max_age(self, client, static_dir):
+        response = client.get('/app.jsx')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/javascript'
+        assert response.cache_control.max_age == api_backend.STATIC_MAX_AGE
+        assert response.cache_control.public
+        assert not response.cache_control.no_cache
+        assert 'immutable' not in response.headers['Cache-Control']
+
+    def test_hashed_file_is_immutable(self, client, static_dir):
+        response = client.get('/app.3f9a1c2b.js')
+
+        assert response.status_code == 200
+        assert response.cache_control.max_age == api_backend.STATIC_IMMUTABLE_MAX_AGE
+        assert 'immutable' in response.headers['Cache-Control']
+
+    def test_revalidation_returns_304(self, client, static_dir):
+        first = client.get('/app.jsx')
+        again = client.get('/app.jsx', headers={'If-None-Match': first.headers['ETag']})
+
+        assert again.status_code == 304
+
+    def test_accel_redirect_keeps_cache_headers(self, client, static_dir, monkeypatch):
+        monkeypatch.setattr(api_backend, 'STATIC_ACCEL_REDIRECT', '/_static/')
+
+        response = client.get('/app.3f9a1c2b.js')
+
+        assert response.headers['X-Accel-Redirect'] == '/_static/app.3f9a1c2b.js'
+        assert response.cache_control.max_age == api_backend.STATIC_IMMUTABLE_MAX_AGE
+        assert response.data == b''
+
+    def test_missing_file_is_not_cached(self, client, static_dir):
+        response = client.get('/missing.js')
+
+        assert response.status_code == 404
+        assert response.cache_control.max_age is None
+
+
+class TestRoleRequired:
+    """Tests for role-restricted endpoints"""
+
+    USER_ID = '6f1c2b1e-0000-4000-8000-000000000002'
+
+    def log_in(self, client, role):
+        """Log in through the session cookie, with claims load_user trusts"""
+        with client.session_transaction() as sess:
+            sess['_user_id'] = self.USER_ID
+            sess['_fresh'] = True
+            sess['user_claims'] = {'user_id': self.USER_ID, 'username': 'carol',
+                                   'email': 'carol@example.com', 'role': role,
+                                   'checked_at': time.time()}
+
+    def test_anonymous_api_request_gets_401(self, client, fake_db):
+        response = client.get('/api/users')
+
+        assert response.status_code == 401
+        assert response.get_json() == {'success': False, 'error': 'Authentication required'}
+        assert fake_db.executed == []
+
+    def test_wrong_role_gets_403(self, client, fake_db):
+        self.log_in(client, 'power')
+
+        response = client.get('/api/users')
+
+        assert response.status_code == 403
+        assert response.get_json() == {'success': False, 'error': 'Unauthorized'}
+        assert fake_db.executed == []
+
+    def test_matching_role_passes(self, client, fake_db):
+        self.log_in(client, 'admin')
+
+        response = client.get('/api/users')
+
+        assert response.status_code == 200
+        assert response.get_json()['success'] is True
+
+    def test_admin_has_power_role(self, fake_db):
+        @api_backend.role_required('power')
+        def view():
+            return 'ok'
+
+        for role, expected in [('regular', 403), ('power', 'ok'), ('admin', 'ok')]:
+            with app.test_request_context('/api/test'):
+                api_backend.login_user(User(self.USER_ID, 'carol', 'carol@example.com', role))
+                result = view()
+            assert (result[1] if isinstance(result, tuple) else result) == expected
+
+    def test_anonymous_page_request_redirects_to_login(self, fake_db):
+        @api_backend.role_required('admin')
+        def view():
+            return 'ok'
+
+        with app.test_request_context('/dashboard'):
+            response = view()
+
+        assert response.status_code == 302
+        assert response.headers['Location'].startswith('/login')
+
+
+class TestORJSONProvider:
+    """Tests for the orjson-backed Flask JSON provider"""
+
+    def test_jsonify_encodes_database_types(self):
+        auction_id = uuid.uuid4()
+        with app.test_request_context('/'):
+            response = jsonify({'auction_id': auction_id, 'closes_at': datetime(2026, 3, 1, 12, 30, 15, 5),
+                                'date': date(2026, 3, 1), 'current_bid': Decimal('125.50')})
+
+        assert response.mimetype == 'application/json'
+        assert response.get_json() == {'auction_id': str(auction_id), 'closes_at': '2026-03-01T12:30:15.000005',
+                                       'date': '2026-03-01', 'current_bid': '125.50'}
+
+    def test_jsonify_matches_dump_json(self):
+        payload = {'success': True, 'created_at': datetime(2026, 1, 2, 3, 4, 5), 'ids': [uuid.uuid4()]}
+        with app.test_request_context('/'):
+            assert jsonify(payload).data == api_backend.dump_json(payload)
+
+    def test_jsonify_args_and_kwargs(self):
+        with app.test_request_context('/'):
+            assert jsonify(1, 2).get_json() == [1, 2]
+            assert jsonify(success=True).get_json() == {'success': True}
+
+    def test_dumps_options_fall_back_to_json(self):
+        text = app.json.dumps({'b': Decimal('1.5'), 'a': 1}, sort_keys=True, indent=2)
+        assert text == '{\n  "a": 1,\n  "b": "1.5"\n}'
+
+    def test_unencodable_type_raises(self):
+        with pytest.raises(TypeError):
+            app.json.dumps({'value': object()})
+
+    def test_get_json_parses_request_body(self):
+        with app.test_request_context('/', method='POST', data='{"bid_amount": 12.5, "tags": ["a"]}',
+                                      content_type='application/json'):
+            assert api_backend.request.get_json() == {'bid_amount': 12.5, 'tags': ['a']}
+
+    def test_invalid_body_is_bad_request(self):
+        with app.test_request_context('/', method='POST', data='{not json',
+                                      content_type='application/json'):
+            with pytest.raises(BadRequest):
+                api_backend.request.get_json()
+            assert api_backend.request.get_json(silent=True) is None
+
+
+class TestAuctionColumns:
+    """Tests that internal auction columns stay out of responses"""
+
+    def select_list(self, query):
+        return query.split('FROM auctions a')[0]
+
+    def test_search_uses_tsvector_only_to_filter(self, client, fake_db):
+        client.get('/api/search?q=furniture')
+
+        query = fake_db.executed[-1][0]
+        assert 'a.*' not in query
+        assert 'search_tsv' not in self.select_list(query)
+        assert 'a.search_tsv @@' in query
+
+    def test_detail_columns_are_named(self, client, fake_db):
+        auction_id = str(uuid.uuid4())
+        fake_db.rows = [{'updated_at': datetime(2026, 1, 1), 'current_bid': 0, 'status': 'active',
+                         'provider_updated_at': None}]
+
+        client.get(f'/api/auctions/{auction_id}')
+
+        prepared = [q for q, _ in fake_db.executed if q.startswith('PREPARE auction_detail')]
+        assert prepared
+        assert 'a.*' not in prepared[-1]
+        assert 'search_tsv' not in prepared[-1]
+        assert 'a.fullness_rating' in prepared[-1]
+
+
+class TestExecutePrepared:
+    """Tests for re-preparing statements after a schema change"""
+
+    QUERY = "SELECT tag_id, tag_name FROM tags WHERE tag_id = $1"
+
+    def test_prepares_once_per_connection(self, fake_db):
+        cursor = fake_db.cursor()
+        api_backend.execute_prepared(cursor, 'tag_by_id', self.QUERY, (1,))
+        api_backend.execute_prepared(cursor, 'tag_by_id', self.QUERY, (2,))
+
+        statements = [q for q, _ in fake_db.executed]
+        assert statements.count(f'PREPARE tag_by_id AS {self.QUERY}') == 1
+        assert statements.count('EXECUTE tag_by_id (%s)') == 2
+
+    def test_stale_plan_is_reprepared_and_retried(self, fake_db):
+        cursor = fake_db.cursor()
+        api_backend.execute_prepared(cursor, 'tag_by_id', self.QUERY, (1,))
+        fake_db.rollback()  # Request finished; next one starts a new transaction
+        fake_db.executed.clear()
+        fake_db.rows = [{'tag_id': 2, 'tag_name': 'tools'}]
+        fake_db.fail_next = [('EXECUTE', FeatureNotSupported('cached plan must not change result type'))]
+
+        api_backend.execute_prepared(cursor, 'tag_by_id', self.QUERY, (2,))
+
+        assert [q for q, _ in fake_db.executed] == [
+            'EXECUTE tag_by_id (%s)',
+            'DEALLOCATE ALL',
+            f'PREPARE tag_by_id AS {self.QUERY}',
+            'EXECUTE tag_by_id (%s)',
+        ]
+        assert fake_db.rollbacks == 2
+        assert list(fake_db.prepared_statements) == ['tag_by_id']
+        assert cursor.fetchall() == [{'tag_id': 2, 'tag_name': 'tools'}]
+
+    def test_stale_plan_mid_transaction_is_not_retried(self, fake_db):
+        cursor = fake_db.cursor()
+        api_backend.execute_prepared(cursor, 'tag_by_id', self.QUERY, (1,))
+        fake_db.executed.clear()
+        fake_db.fail_next = [('EXECUTE', FeatureNotSupported('cached plan must not change result type'))]
+
+        with pytest.raises(FeatureNotSupported):
+            api_backend.execute_prepared(cursor, 'tag_by_id', self.QUERY, (2,))
+
+        # Statements are still dropped, so the next request prepares afresh
+        assert [q for q, _ in fake_db.executed] == ['EXECUTE tag_by_id (%s)', 'DEALLOCATE ALL']
+        assert not fake_db.prepared_statements
+
+
+class TestAuctionsBatch:
+    """Tests for fetching several auctions by id"""
+
+    def test_malformed_ids_rejected(self, client, fake_db):
+        good = str(uuid.uuid4())
+
+        response = client.get(f'/api/auctions/batch?ids={good},abc,12-34')
+
+        assert response.status_code == 400
+        body = response.get_json()
+        assert body['success'] is False
+        assert body['invalid_ids'] == ['abc', '12-34']
+        assert fake_db.executed == []
+
+    def test_returns_rows_in_requested_order(self, client, fake_db):
+        first, second = uuid.uuid4(), uuid.uuid4()
+        fake_db.rows = [{'auction_id': second}, {'auction_id': first}]
+
+        response = client.get(f'/api/auctions/batch?ids={str(first).upper()},{second},{uuid.uuid4()}')
+
+        body = response.get_json()
+        assert response.status_code == 200
+        assert [a['auction_id'] for a in body['auctions']] == [str(first), str(second)]
+        params = [p for q, p in fake_db.executed if q.startswith('EXECUTE auction_detail_batch')][-1]
+        assert params[0][:2] == [str(first), str(second)]
+
+
+class TestGetUsers:
+    """Tests for paging the admin user list"""
+
+    @pytest.fixture
+    def admin_client(self, client):
+        TestRoleRequired().log_in(client, 'admin')
+        return client
+
+    def user_rows(self, count):
+        return [{'user_id': uuid.uuid4(), 'username': f'user{i}',
+                 'created_at': datetime(2026, 1, 1, 0, 0, i)} for i in range(count)]
+
+    def test_full_page_has_cursor(self, admin_client, fake_db):
+        fake_db.rows = self.user_rows(2)
+
+        body = admin_client.get('/api/users?limit=2').get_json()
+
+        assert body['count'] == 2
+        assert body['next_cursor'] == {'before_created_at': '2026-01-01T00:00:01',
+                                       'before_id': str(fake_db.rows[-1]['user_id'])}
+
+    def test_short_page_has_no_cursor(self, admin_client, fake_db):
+        fake_db.rows = self.user_rows(1)
+
+        assert admin_client.get('/api/users?limit=2').get_json()['next_cursor'] is None
+
+    def test_no_limit_has_no_cursor(self, admin_client, fake_db):
+        fake_db.rows = self.user_rows(3)
+
+        body = admin_client.get('/api/users').get_json()
+
+        assert body['count'] == 3
+        assert 'next_cursor' not in body or body['next_cursor'] is None
+        assert 'LIMIT' not in fake_db.executed[-1][0]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
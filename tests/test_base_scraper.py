@@ -0,0 +1,185 @@
+"""
+Unit tests for saving scraped auctions in batches
+
+Runs without a database: get_db_connection returns a FakeDatabase
+connection, and execute_values is replaced with one that records each
+batch and fails it if any row holds a value Postgres would reject.
+"""
+
+import pytest
+import os
+import sys
+import uuid
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psycopg2
+
+import scrapers.base_scraper
+from scrapers.base_scraper import BaseScraper
+from scrapers.bid13_scraper import Bid13Scraper
+
+PROVIDER_ID = '00000000-0000-0000-0000-000000000000'
+BAD_DATE = 'next Tuesday'  # Fails the ::timestamp cast
+
+
+class FakeDatabase:
+    """Auctions table stand-in shared by every connection a scraper opens"""
+
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.batches = []  # (statement, rows) per execute_values call
+        self.single_saves = []  # External IDs written by save_auction
+        self.commits = 0
+        self.rollbacks = 0
+
+    def connect(self):
+        return FakeConnection(self)
+
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def commit(self):
+        self.db.commits += 1
+
+    def rollback(self):
+        self.db.rollbacks += 1
+
+    def close(self):
+        pass
+
+
+class FakeCursor:
+    """Answers the handful of statements BaseScraper sends"""
+
+    def __init__(self, db):
+        self.db = db
+        self.looked_up = None
+        self.rows = []
+
+    def execute(self, query, params=None):
+        query = ' '.join(query.split())
+        if query.startswith('SELECT DISTINCT external_auction_id'):
+            self.rows = [{'external_auction_id': i} for i in params[1] if i in self.db.existing]
+        elif query.startswith('SELECT auction_id FROM auctions'):
+            self.looked_up = params[0]
+            self.rows = [{'auction_id': uuid.uuid4()}] if params[0] in self.db.existing else []
+        elif query.startswith(('UPDATE auctions', 'INSERT INTO auctions')):
+            if BAD_DATE in params:
+                raise psycopg2.DataError(f'invalid input syntax for type timestamp: "{BAD_DATE}"')
+            # save_auction looks the auction up before updating it; inserts
+            # end with the external_auction_id
+            ext_id = self.looked_up if query.startswith('UPDATE') else params[-1]
+            self.db.single_saves.append(ext_id)
+            self.rows = [{'auction_id': uuid.uuid4()}]
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def db(monkeypatch):
+    database = FakeDatabase()
+
+    def execute_values(cursor, sql, argslist, template=None, page_size=100):
+        rows = list(argslist)
+        cursor.db.batches.append((' '.join(sql.split()[:2]), rows))
+        if any(BAD_DATE in row for row in rows):
+            raise psycopg2.DataError(f'invalid input syntax for type timestamp: "{BAD_DATE}"')
+
+    monkeypatch.setattr(scrapers.base_scraper, 'execute_values', execute_values)
+    return database
+
+
+@pytest.fixture
+def scraper(db, monkeypatch):
+    scraper = BaseScraper(PROVIDER_ID)
+    monkeypatch.setattr(scraper, 'get_db_connection', db.connect)
+    return scraper
+
+
+def auction(ext_id, **fields):
+    data = {'external_auction_id': ext_id, 'unit_number': f'U-{ext_id}',
+            'closes_at': datetime(2026, 11, 1, 12, 0), 'current_bid': 100}
+    data.update(fields)
+    return data
+
+
+class TestSaveAuctions:
+    """Tests for BaseScraper.save_auctions"""
+
+    def test_splits_new_and_existing(self, scraper, db):
+        db.existing = {'2', '4'}
+
+        saved = scraper.save_auctions([auction('1'), auction('2'), auction('3'), auction('4')])
+
+        assert saved == {'added': 2, 'updated': 2, 'failed': 0}
+        statements = dict(db.batches)
+        # UPDATE rows: (provider_id, external_auction_id, ...)
+        assert [row[1] for row in statements['UPDATE auctions']] == ['2', '4']
+        # INSERT rows end with the external_auction_id
+        assert [row[-1] for row in statements['INSERT INTO']] == ['1', '3']
+        assert db.commits == 1
+        assert db.single_saves == []
+
+    def test_later_duplicate_wins(self, scraper, db):
+        db.existing = {'2'}
+
+        saved = scraper.save_auctions([
+            auction('1', current_bid=100),
+            auction('2', current_bid=200),
+            auction('1', current_bid=150),
+            auction('2', current_bid=250),
+        ])
+
+        assert saved == {'added': 1, 'updated': 1, 'failed': 0}
+        [insert] = [rows for sql, rows in db.batches if sql == 'INSERT INTO']
+        [update] = [rows for sql, rows in db.batches if sql == 'UPDATE auctions']
+        assert len(insert) == 1 and insert[0][13] == 150  # current_bid
+        assert len(update) == 1 and update[0][11] == 250
+
+    def test_skips_rows_missing_required_fields(self, scraper, db):
+        saved = scraper.save_auctions([auction('1', closes_at=None), {'closes_at': datetime(2026, 11, 1)}])
+
+        assert saved == {'added': 0, 'updated': 0, 'failed': 0}
+        assert db.batches == []
+
+    def test_bad_row_falls_back_to_single_saves(self, scraper, db):
+        db.existing = {'2'}
+
+        saved = scraper.save_auctions([auction('1'), auction('2'), auction('3', closes_at=BAD_DATE)])
+
+        assert saved == {'added': 1, 'updated': 1, 'failed': 1}
+        assert db.rollbacks == 2  # The batch, then the bad row on its own
+        # Every good row still saved, one at a time
+        assert sorted(db.single_saves) == ['1', '2']
+
+    def test_failed_rows_logged_as_partial(self, db, monkeypatch):
+        scraper = Bid13Scraper(PROVIDER_ID, 'https://bid13.com/test')
+        monkeypatch.setattr(scraper, 'get_db_connection', db.connect)
+        monkeypatch.setattr(scraper, 'scrape_all', lambda: [
+            auction('1'), auction('2', closes_at=BAD_DATE)])
+        logged = []
+        monkeypatch.setattr(scraper, 'log_scrape', lambda *args: logged.append(args))
+
+        result = scraper.run_scraper()
+
+        assert result['auctions_added'] == 1
+        assert logged == [('partial', 2, 1, 0, '1 auctions failed to save')]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
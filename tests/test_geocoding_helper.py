@@ -0,0 +1,283 @@
+"""
+Unit tests for the geocoder's shared cache state and cache writes
+
+Runs without a database: execute_values is replaced with a recorder, and
+connections are simple stand-ins that count commits and checkouts.
+"""
+
+import pytest
+import os
+import sys
+import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psycopg2.extras
+
+import geocoding_helper
+from geocoding_helper import SimpleGeocoder
+
+
+class FakeCursor:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    """Connection stand-in that counts commits and rollbacks"""
+
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, **kwargs):
+        return FakeCursor()
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    """Give each test empty process-wide memo and hit counters"""
+    monkeypatch.setattr(geocoding_helper, '_memo', OrderedDict())
+    monkeypatch.setattr(geocoding_helper, '_pending_hits', Counter())
+    monkeypatch.setattr(geocoding_helper, '_pending_hits_total', 0)
+    monkeypatch.setattr(geocoding_helper, '_last_hits_flush', geocoding_helper.time.monotonic())
+    monkeypatch.setattr(geocoding_helper, '_inflight', {})
+
+
+@pytest.fixture
+def statements(monkeypatch):
+    """Record execute_values calls as (sql, rows) instead of running them"""
+    recorded = []
+
+    def execute_values(cursor, sql, argslist, **kwargs):
+        recorded.append((' '.join(sql.split()), list(argslist)))
+        return []
+
+    monkeypatch.setattr(psycopg2.extras, 'execute_values', execute_values)
+    return recorded
+
+
+@pytest.fixture
+def write_connection():
+    """db_conn-style callable that counts checkouts"""
+    conn = FakeConnection()
+    conn.checkouts = 0
+
+    @contextmanager
+    def db_conn():
+        conn.checkouts += 1
+        yield conn
+
+    db_conn.conn = conn
+    return db_conn
+
+
+class TestDeferredWrites:
+    """Tests for queuing cache writes until the caller releases its connection"""
+
+    def test_saves_wait_for_flush_writes(self, statements, write_connection):
+        geocoder = SimpleGeocoder(db_connection=FakeConnection(), write_connection=write_connection)
+
+        geocoder.save_to_cache_many([('zipcode', '95814', 38.58, -121.49),
+                                     ('city_state', 'Davis,CA', 38.54, -121.74)])
+
+        assert statements == []
+        assert write_connection.conn.checkouts == 0
+        # Answered from the memo straight away
+        assert geocoder.geocode_zipcode('95814') == (38.58, -121.49)
+
+        geocoder.flush_writes()
+
+        assert write_connection.conn.checkouts == 1
+        [(sql, rows)] = statements
+        assert sql.startswith('INSERT INTO geocoded_locations')
+        # Key order, so concurrent upserts lock rows in the same order
+        assert rows == [('city_state', 'Davis,CA', 38.54, -121.74),
+                        ('zipcode', '95814', 38.58, -121.49)]
+
+        geocoder.flush_writes()
+        assert len(statements) == 1
+
+    def test_without_write_connection_saves_commit_immediately(self, statements):
+        conn = FakeConnection()
+        geocoder = SimpleGeocoder(db_connection=conn)
+
+        geocoder.save_to_cache_many([('zipcode', '95814', 38.58, -121.49)])
+
+        assert len(statements) == 1
+        assert conn.commits == 1
+
+    def test_hit_counts_wait_for_flush_writes(self, statements, write_connection, monkeypatch):
+        monkeypatch.setattr(geocoding_helper, 'HIT_COUNT_FLUSH_SIZE', 2)
+        geocoding_helper._memo_put('zipcode', '95814', (38.58, -121.49))
+        geocoder = SimpleGeocoder(db_connection=FakeConnection(), write_connection=write_connection)
+
+        geocoder.geocode_zipcode('95814')
+        geocoder.geocode_zipcode('95814')
+
+        assert statements == []
+
+        geocoder.flush_writes()
+
+        assert [sql.split()[0] for sql, _ in statements] == ['SELECT', 'UPDATE']
+        assert statements[1][1] == [('zipcode', '95814', 2)]
+
+
+class TestSingleFlight:
+    """Tests for sharing one Nominatim lookup between concurrent callers"""
+
+    def run_concurrently(self, fetch):
+        """
+        Start an owner call whose fetch blocks, then a waiter for the same
+        location, then let the fetch finish. Returns both outcomes.
+        """
+        release = threading.Event()
+        calls = []
+
+        def blocking_fetch():
+            calls.append(threading.current_thread().name)
+            release.wait(5)
+            return fetch()
+
+        outcomes = {}
+
+        def call(name):
+            try:
+                outcomes[name] = geocoding_helper._single_flight('zipcode', '95814', blocking_fetch)
+            except Exception as e:
+                outcomes[name] = e
+
+        owner = threading.Thread(target=call, args=('owner',), name='owner')
+        owner.start()
+        while not geocoding_helper._inflight:
+            owner.join(0.01)
+
+        waiter = threading.Thread(target=call, args=('waiter',), name='waiter')
+        waiter.start()
+        waiter.join(0.1)
+        assert waiter.is_alive()  # Blocked on the owner's lookup
+
+        release.set()
+        owner.join(5)
+        waiter.join(5)
+        return outcomes, calls
+
+    def test_waiter_gets_owners_result(self):
+        outcomes, calls = self.run_concurrently(lambda: (38.58, -121.49))
+
+        assert outcomes == {'owner': (38.58, -121.49), 'waiter': (38.58, -121.49)}
+        assert calls == ['owner']
+        assert geocoding_helper._inflight == {}
+
+    def test_waiter_gets_owners_exception(self):
+        error = ConnectionError('Nominatim unavailable')
+
+        def fail():
+            raise error
+
+        outcomes, calls = self.run_concurrently(fail)
+
+        assert outcomes == {'owner': error, 'waiter': error}
+        assert calls == ['owner']
+        assert geocoding_helper._inflight == {}
+
+    def test_next_call_fetches_again(self):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            return (38.58, -121.49)
+
+        geocoding_helper._single_flight('zipcode', '95814', fetch)
+        with pytest.raises(ValueError):
+            geocoding_helper._single_flight('zipcode', '95814', lambda: int('x'))
+        geocoding_helper._single_flight('zipcode', '95814', fetch)
+
+        assert len(calls) == 2
+        assert geocoding_helper._inflight == {}
+
+
+class TestHitCounts:
+    """Tests for batching cache hit counts"""
+
+    def record(self, count, key=('zipcode', '95814')):
+        for _ in range(count):
+            geocoding_helper._record_hit(*key)
+
+    def test_held_until_flush_size(self, monkeypatch):
+        monkeypatch.setattr(geocoding_helper, 'HIT_COUNT_FLUSH_SIZE', 3)
+
+        self.record(2)
+        assert geocoding_helper._take_pending_hits() == {}
+
+        self.record(1)
+        assert geocoding_helper._take_pending_hits() == {('zipcode', '95814'): 3}
+        assert geocoding_helper._pending_hits_total == 0
+        assert geocoding_helper._take_pending_hits() == {}
+
+    def test_flushed_after_interval(self, monkeypatch):
+        self.record(1)
+        assert geocoding_helper._take_pending_hits() == {}
+
+        monkeypatch.setattr(geocoding_helper, '_last_hits_flush',
+                            geocoding_helper.time.monotonic() - geocoding_helper.HIT_COUNT_FLUSH_INTERVAL)
+        assert geocoding_helper._take_pending_hits() == {('zipcode', '95814'): 1}
+
+    def test_flush_writes_counts(self, statements, monkeypatch):
+        monkeypatch.setattr(geocoding_helper, 'HIT_COUNT_FLUSH_SIZE', 3)
+        conn = FakeConnection()
+        self.record(2)
+        self.record(1, ('city_state', 'Davis,CA'))
+
+        SimpleGeocoder(db_connection=conn)._flush_hit_counts()
+
+        assert sorted(statements[1][1]) == [('city_state', 'Davis,CA', 1), ('zipcode', '95814', 2)]
+        assert conn.commits == 1
+        assert not geocoding_helper._pending_hits
+
+    def test_failed_flush_restores_counts(self, statements, monkeypatch):
+        monkeypatch.setattr(geocoding_helper, 'HIT_COUNT_FLUSH_SIZE', 3)
+
+        def fail(*args, **kwargs):
+            raise RuntimeError('could not obtain lock')
+
+        monkeypatch.setattr(psycopg2.extras, 'execute_values', fail)
+        conn = FakeConnection()
+        self.record(3)
+        self.record(1, ('city_state', 'Davis,CA'))
+
+        SimpleGeocoder(db_connection=conn)._flush_hit_counts()
+
+        assert conn.rollbacks == 1
+        assert geocoding_helper._pending_hits == {('zipcode', '95814'): 3, ('city_state', 'Davis,CA'): 1}
+        assert geocoding_helper._pending_hits_total == 4
+
+    def test_restored_counts_merge_with_new_hits(self, statements, monkeypatch):
+        monkeypatch.setattr(geocoding_helper, 'HIT_COUNT_FLUSH_SIZE', 3)
+        self.record(3)
+        hits = geocoding_helper._take_pending_hits()
+        self.record(2)  # Arrive while the flush is running
+
+        geocoding_helper._restore_pending_hits(hits)
+        SimpleGeocoder(db_connection=FakeConnection())._flush_hit_counts()
+
+        assert statements[1][1] == [('zipcode', '95814', 5)]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,46 @@
+"""
+Unit tests for scraper selection by source URL
+"""
+
+import pytest
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scrapers import get_scraper, Bid13Scraper, StorageAuctionsScraper
+
+PROVIDER_ID = '00000000-0000-0000-0000-000000000000'
+
+
+class TestGetScraper:
+    """Tests for picking a scraper from a provider's source_url"""
+
+    @pytest.mark.parametrize('url', [
+        'https://bid13.com/facilities/test',
+        'https://www.bid13.com/facilities/test',
+        'http://BID13.COM/facilities/test',
+        'bid13.com/facilities/test',
+    ])
+    def test_bid13_urls(self, url):
+        scraper = get_scraper(PROVIDER_ID, url)
+        assert isinstance(scraper, Bid13Scraper)
+        assert scraper.facility_url == url
+
+    def test_storageauctions_url(self):
+        scraper = get_scraper(PROVIDER_ID, 'https://www.storageauctions.com/auctions')
+        assert isinstance(scraper, StorageAuctionsScraper)
+
+    @pytest.mark.parametrize('url', [
+        None,
+        '',
+        'https://example.com/bid13.com',
+        'https://notbid13.com/facilities/test',
+    ])
+    def test_unknown_urls(self, url):
+        assert get_scraper(PROVIDER_ID, url) is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])